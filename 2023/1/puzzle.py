@@ -1,45 +1,101 @@
-import re
+from collections import deque
 
 def readInput():
     with open((__file__.rstrip("puzzle.py")+"input.txt"), 'r') as input_file:
         return input_file.read().split()
 
+def stream_lines(path=None):
+    """Yield the lines of the input file as bytes, one at a time."""
+    with open(path or (__file__.rstrip("puzzle.py")+"input.txt"), 'rb') as input_file:
+        for line in input_file:
+            yield line.rstrip(b'\r\n')
+
 def parse(lines):
     return lines.splitlines()
 
+WORDS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9
+}
+DIGITS = {str(digit): digit for digit in range(10)}
+
 def convert_text_to_number(text):
-    words_to_numbers = {
-        'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-        'six': 6, 'seven': 7, 'eight': 8, 'nine': 9
-    }
-    return words_to_numbers.get(text,0)
+    return WORDS.get(text,0)
+
+def _build_automaton(patterns):
+    """
+    Aho-Corasick automaton over bytes, compiled to a full transition table.
+
+    Returns (delta, output): delta[state][byte] is the next state and
+    output[state] the value of a pattern ending there, or -1.
+    """
+    goto, output = [{}], [-1]
+    for pattern, value in patterns.items():
+        state = 0
+        for byte in pattern.encode():
+            if byte not in goto[state]:
+                goto.append({})
+                output.append(-1)
+                goto[state][byte] = len(goto) - 1
+            state = goto[state][byte]
+        output[state] = value
+
+    delta = [None] * len(goto)
+    delta[0] = [goto[0].get(byte, 0) for byte in range(256)]
+    queue = deque((child, 0) for child in goto[0].values())
+    while queue:
+        state, fail = queue.popleft()
+        if output[state] < 0:
+            output[state] = output[fail]
+        delta[state] = [goto[state].get(byte, delta[fail][byte]) for byte in range(256)]
+        queue.extend((child, delta[fail][byte]) for byte, child in goto[state].items())
+    return delta, output
+
+def _first_match(automaton, data):
+    delta, output = automaton
+    state = 0
+    for byte in data:
+        state = delta[state][byte]
+        if output[state] >= 0:
+            return output[state]
+    return None
+
+class DigitScanner:
+    """
+    Finds the first and last digit in a line, spelled or not.
+
+    One automaton runs forward from the start of the line and a second one,
+    built from the reversed patterns, runs backward from the end, so each
+    side stops at its first hit. Overlapping words like "oneight" need no
+    lookahead. No pattern contains another, so the first match to end is
+    also the first to start.
+    """
+
+    def __init__(self, patterns):
+        self.forward = _build_automaton(patterns)
+        self.backward = _build_automaton({pattern[::-1]: value for pattern, value in patterns.items()})
+
+    def calibration_value(self, line):
+        if isinstance(line, str):
+            line = line.encode()
+        first = _first_match(self.forward, line)
+        if first is None:
+            return 0
+        return 10 * first + _first_match(self.backward, reversed(line))
+
+    def total(self, lines):
+        return sum(map(self.calibration_value, lines))
+
+DIGIT_SCANNER = DigitScanner(DIGITS)
+WORD_SCANNER = DigitScanner({**DIGITS, **WORDS})
 
 def solvePartA(data):
-    total = 0
-    
-    for text in data:
-        
-        digits = re.findall(r'\d', text)
-        if(digits):
-            num = 10* int(digits[0])+ int(digits[-1])
-            total = total + num
-    return total
+    return DIGIT_SCANNER.total(data)
 
 def solvePartB(data):
-    total = 0
-
-    
-    for text in data:        
-        matches = re.finditer(r'(?=(\d|one|two|three|four|five|six|seven|eight|nine))', text)
-        digits = [match.group(1) for match in matches]
-
-        first_number = 0
-        last_number = 0
-        if(digits):
-            first_number = int(digits[0]) if digits[0].isdigit() else convert_text_to_number(digits[0])
-            last_number = int(digits[-1]) if digits[-1].isdigit() else convert_text_to_number(digits[-1])
-                
-            num = 10* first_number+ last_number
-
-            total = total + num
-    return total
\ No newline at end of file
+    return WORD_SCANNER.total(data)
+
+def solve_file(path=None, spelled=True):
+    """Sum of calibration values streamed from a file of any size."""
+    scanner = WORD_SCANNER if spelled else DIGIT_SCANNER
+    return scanner.total(stream_lines(path))
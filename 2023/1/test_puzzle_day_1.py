@@ -65,4 +65,15 @@ def test_pass_solveB():
     input = puzzle.readInput()
     answer = puzzle.solvePartB(input)
     print(answer)
-    assert answer == 55614
\ No newline at end of file
+    assert answer == 55614
+
+def test_scanner_overlaps_and_edges():
+    assert puzzle.WORD_SCANNER.calibration_value("oneight") == 18
+    assert puzzle.WORD_SCANNER.calibration_value(b"xtwone3four") == 24
+    assert puzzle.WORD_SCANNER.calibration_value("nothing") == 0
+
+def test_solve_file_streams_input(tmp_path):
+    path = tmp_path / "calibration.txt"
+    path.write_text(TEST_INPUT_DIGITS_AS_TEXT)
+    assert puzzle.solve_file(path) == 281
+    assert puzzle.solve_file(path, spelled=False) == puzzle.solvePartA(puzzle.parse(TEST_INPUT_DIGITS_AS_TEXT))
@@ -1,12 +1,8 @@
-from collections import defaultdict
 import sys
-import re
-from functools import reduce
-import numpy as np
-import pandas as pd
-from collections import deque
-from scipy.spatial import Voronoi, voronoi_plot_2d
-import matplotlib.pyplot as plt
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # repo root, for utils/
+from utils.helpers import Grid
 
 
 def readInput():
@@ -22,62 +18,75 @@ def parse(input):
     }
 
 
-def trace_path(map):
-    start_x, start_y = next((x, y) for (x, y), value in map.items() if value == "S")
-
-    x, y = start_x, start_y
-    direction = (
-        "N"
-        if map.get((x, y - 1), "X") in "|7F"
-        else "E"
-        if map.get((x - 1, y), "X") in "-J7"
-        else "S"
-        if map.get((x, y + 1), "X") in "|LJ"
-        else "W"
-        if map.get((x - 1, y), "X") in "-LF"
-        else "?"
-    )
-
-    steps = {}
-    step_count = 0
-    direction_deltas = {"N": (0, -1), "E": (1, 0), "S": (0, 1), "W": (-1, 0)}
-    direction_changes = {
-        (dir1, map_char): dir2
-        for (dir1, map_char), dir2 in {
-            ("N", "|"): "N",
-            ("N", "F"): "E",
-            ("N", "7"): "W",
-            ("E", "-"): "E",
-            ("E", "J"): "N",
-            ("E", "7"): "S",
-            ("S", "|"): "S",
-            ("S", "J"): "W",
-            ("S", "L"): "E",
-            ("W", "-"): "W",
-            ("W", "L"): "N",
-            ("W", "F"): "S",
-        }.items()
-    }
+# Sum of the two direction offsets each pipe connects, as multiples of
+# (row stride, column): leaving direction = entry direction + this sum
+PIPES = {"|": (0, 0), "-": (0, 0), "L": (-1, 1), "J": (-1, -1), "7": (1, -1), "F": (1, 1)}
 
-    while True:
-        steps[(x, y)] = step_count
 
-        dx, dy = direction_deltas[direction]
-        x += dx
-        y += dy
-        step_count += 1
-        if (x, y) == (start_x, start_y):
+def trace_loop(input):
+    """
+    Follow the loop through S on a padded Grid.
+
+    Cells are flat indices into the grid and directions are its neighbour
+    offsets, so each step is one addition and one table lookup, and the
+    padding keeps the scan around S free of bounds checks. Returns (loop
+    indices starting at S, grid).
+    """
+    grid = Grid.from_text(input, pad=1)
+    data, stride = grid.data, grid.stride
+    turn = {ord(pipe): rows * stride + cols for pipe, (rows, cols) in PIPES.items()}
+    north, east, south, west = grid.neighbours4
+    connects = {
+        north: b"|7F", south: b"|LJ", west: b"-LF", east: b"-J7",
+    }
+
+    start = grid.find("S")
+    for direction in (north, south, east, west):
+        if data[start + direction] in connects[direction]:
             break
+    else:
+        raise ValueError("S is not connected to a pipe")
 
-        direction = direction_changes[(direction, map[(x, y)])]
+    loop = [start]
+    position = start + direction
+    while position != start:
+        loop.append(position)
+        direction += turn[data[position]]
+        position += direction
+    return loop, grid
 
-    return steps, step_count
+
+def trace_path(map):
+    width = max(x for x, _ in map) + 1
+    height = max(y for _, y in map) + 1
+    text = "\n".join("".join(map[(x, y)] for x in range(width)) for y in range(height))
+    loop, grid = trace_loop(text)
+    steps = {grid.position(position)[::-1]: step for step, position in enumerate(loop)}
+    return steps, len(loop)
 
 
 def solvePartOne(input):
-    map = parse(input)
-    steps, step_count = trace_path(map)
-    return step_count / 2
+    loop, _ = trace_loop(input)
+    return len(loop) // 2
+
+
+def count_enclosed(input):
+    """
+    Tiles enclosed by the loop, in O(loop length).
+
+    The shoelace formula gives the area A of the polygon through the tile
+    centres, and Pick's theorem A = I + B / 2 - 1 turns that into the number
+    of interior tiles I, with B the number of loop tiles.
+    """
+    loop, grid = trace_loop(input)
+    stride = grid.stride
+    twice_area = 0
+    previous_row, previous_col = divmod(loop[-1], stride)
+    for position in loop:
+        row, col = divmod(position, stride)
+        twice_area += previous_col * row - col * previous_row
+        previous_row, previous_col = row, col
+    return abs(twice_area) // 2 - len(loop) // 2 + 1
 
 
 def scan_path(map):
@@ -105,6 +114,4 @@ def scan_path(map):
 
 
 def solvePartTwo(input):
-    map = parse(input)
-    result = scan_path(map)
-    return len(result)
+    return count_enclosed(input)
@@ -89,3 +89,7 @@ def test_pass_solveTwo(capsys):
     print(f"Part Two : {answer}")
     # Original commented assertion left as-is
     # assert 0 == answer
+
+@pytest.mark.parametrize("grid, expected", [(TEST_INPUT, 1), (TEST_INPUT3, 4), (TEST_INPUT4, 8)])
+def test_count_enclosed_matches_scan(grid, expected):
+    assert puzzle.count_enclosed(grid) == expected == len(puzzle.scan_path(puzzle.parse(grid)))
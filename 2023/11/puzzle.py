@@ -1,11 +1,3 @@
-import sys
-import re
-from functools import reduce
-import numpy as np
-import pandas as pd
-from collections import deque
-
-
 def readInput():
     with open((__file__.rstrip("puzzle.py") + "input.txt"), "r") as input_file:
         return input_file.read()
@@ -76,52 +68,6 @@ def find_object_positions(grid):
     return object_positions
 
 
-def bfs(grid, start, end):
-    if start == end:
-        return 0
-
-    rows, cols = len(grid), len(grid[0])
-    visited = [[False] * cols for _ in range(rows)]
-    queue = deque()
-    queue.append((start[0], start[1], 0))  # (row, col, distance)
-    visited[start[0]][start[1]] = True
-
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
-
-    while queue:
-        row, col, dist = queue.popleft()
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-
-            if (
-                0 <= new_row < rows
-                and 0 <= new_col < cols
-                and not visited[new_row][new_col]
-                and grid[new_row][new_col] == "."
-            ):
-                if (new_row, new_col) == end:
-                    return dist + 1
-
-                visited[new_row][new_col] = True
-                queue.append((new_row, new_col, dist + 1))
-
-    return -1  # No path found
-
-
-def compute_all_distances(grid, object_positions):
-    distances = {}
-    num_objects = len(object_positions)
-
-    for i in range(num_objects):
-        for j in range(i + 1, num_objects):
-            start = object_positions[i]
-            end = object_positions[j]
-            distance = bfs(grid, start, end)
-            distances[(i, j)] = distance
-
-    return distances
-
-
 def compute_all_distances_manhattan(object_positions):
     distances = {}
     num_objects = len(object_positions)
@@ -136,66 +82,57 @@ def compute_all_distances_manhattan(object_positions):
     return distances
 
 
-def sum_of_shortest_paths(object_positions):
-    total_sum = 0
-    num_objects = len(object_positions)
-
-    for i in range(num_objects):
-        for j in range(i + 1, num_objects):
-            x1, y1 = object_positions[i]
-            x2, y2 = object_positions[j]
-            distance = abs(x2 - x1) + abs(y2 - y1)
-            total_sum += distance
+def pairwise_distance_sum(values):
+    """
+    Sum of |a - b| over all pairs, from the sorted values.
 
-    return total_sum
+    The i-th smallest of n values is added i times and subtracted
+    n - 1 - i times.
+    """
+    values = sorted(values)
+    n = len(values)
+    return sum((2 * i - n + 1) * value for i, value in enumerate(values))
 
 
-def solvePartOne(input_data):
-    # # Step 1: Parse the input
-    # input_data = readInput()
-    parsed = parse(input_data)
-    grid = expand_grid(parsed)
+def sum_of_shortest_paths(object_positions):
+    return sum(pairwise_distance_sum(axis) for axis in zip(*object_positions))
 
-    # Step 2: Find the object positions
-    object_positions = find_object_positions(grid)
 
-    # Step 3: Compute the sum of all shortest paths using Manhattan distance
-    total_sum = sum_of_shortest_paths(object_positions)
+def _axis_sums(coordinates, size):
+    """
+    (base, per-factor) parts of the pairwise distance sum along one axis.
 
-    return total_sum
+    An empty line before a coordinate pushes it out by factor - 1, and the
+    number of such lines is a prefix count. Expansion keeps the order, so
+    the sum is base + (factor - 1) * per-factor.
+    """
+    occupied = bytearray(size)
+    for coordinate in coordinates:
+        occupied[coordinate] = 1
+    empty_before = [0] * size
+    for line in range(1, size):
+        empty_before[line] = empty_before[line - 1] + (not occupied[line - 1])
+    coordinates = sorted(coordinates)
+    return (pairwise_distance_sum(coordinates),
+            pairwise_distance_sum(empty_before[c] for c in coordinates))
 
 
-def sum_of_shortest_paths_with_factor_expansion(input_grid, factor):
-    # Step 1: Parse the input to find object positions and grid dimensions
-    positions, rows, cols = parse_input(input_grid)
+def distance_sums(input_grid, factors):
+    """Sum of galaxy pair distances for each expansion factor, from one pass."""
+    galaxies = find_object_positions(input_grid)
+    rows, cols = zip(*galaxies) if galaxies else ((), ())
+    row_base, row_gaps = _axis_sums(rows, len(input_grid))
+    col_base, col_gaps = _axis_sums(cols, len(input_grid[0]) if input_grid else 0)
+    return [row_base + col_base + (factor - 1) * (row_gaps + col_gaps) for factor in factors]
 
-    # Step 2: Identify rows and columns without objects
-    empty_rows = [i for i in range(rows) if i not in positions["rows"]]
-    empty_columns = [j for j in range(cols) if j not in positions["cols"]]
-    object_positions = find_object_positions(input_grid)
 
-    # Step 3: Calculate new positions of objects based on the empty rows and columns
-    galaxies = []
-    for i, j in object_positions:
-        new_i = i + sum(1 for x in empty_rows if x < i) * (factor - 1)
-        new_j = j + sum(1 for x in empty_columns if x < j) * (factor - 1)
-        galaxies.append((new_i, new_j))
+def solvePartOne(input_data):
+    return sum_of_shortest_paths_with_factor_expansion(parse(input_data), 2)
 
-    # Step 4: Compute the sum of Manhattan distances between all pairs of objects
-    total_sum = 0
-    for i in range(len(galaxies)):
-        for j in range(i + 1, len(galaxies)):
-            total_sum += abs(galaxies[i][0] - galaxies[j][0]) + abs(
-                galaxies[i][1] - galaxies[j][1]
-            )
 
-    return total_sum
+def sum_of_shortest_paths_with_factor_expansion(input_grid, factor):
+    return distance_sums(input_grid, [factor])[0]
 
 
 def solvePartTwo(input_data):
-    parsed = parse(input_data)
-
-    # Calculate the sum of the shortest paths after expanding the grid by a factor of 100
-    computed_sum = sum_of_shortest_paths_with_factor_expansion(parsed, 1000000)
-
-    return computed_sum
+    return sum_of_shortest_paths_with_factor_expansion(parse(input_data), 1000000)
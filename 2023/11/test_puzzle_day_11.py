@@ -155,3 +155,7 @@ def test_pass_solveTwo():
     print(f"Part Two : {answer}")
     expected_sum = 625243292686
     assert answer == expected_sum, f"Expected {expected_sum}, but got {answer}"
+
+
+def test_distance_sums_for_many_factors(parsed_grid_without_expand):
+    assert puzzle.distance_sums(parsed_grid_without_expand, [1, 2, 10, 100]) == [292, 374, 1030, 8410]
@@ -1,4 +1,6 @@
-from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+DOT, HASH = ord("."), ord("#")
 
 
 def readInput():
@@ -13,37 +15,67 @@ def parse_rows(input_string):
     ]
 
 
-def count_combinations(row, rules):
-    groups = tuple(map(int, rules.split(",")))
-    
-    @lru_cache(maxsize=None)
-    def solve(row, group_index=0, current_group_count=0):
-        if group_index == len(groups):
-            return '#' not in row
-        if not row:
-            return group_index == len(groups) - 1 and current_group_count == groups[group_index]
-        
-        result = 0
-        if row[0] in '.?':
-            if current_group_count == groups[group_index]:
-                result += solve(row[1:], group_index + 1, 0)
-            elif current_group_count == 0:
-                result += solve(row[1:], group_index, 0)
-        if row[0] in '#?':
-            if group_index < len(groups) and current_group_count < groups[group_index]:
-                result += solve(row[1:], group_index, current_group_count + 1)
-        
-        return result
-
-    return solve(row)
+def count_combinations(row, rules, unfold=1):
+    """
+    Count the arrangements of damaged springs matching the group rules.
+
+    Works bottom-up over (position, group index) on the row as bytes.
+    ways[i] holds the arrangements of the remaining groups in row[i:],
+    rebuilt once per group from the back. A group of length k can start
+    at i when row[i:i + k] has no '.', which prefix counts of '.' answer
+    in O(1), and the cell after it is not '#'.
+    """
+    data = "?".join([row] * unfold).encode()
+    groups = list(map(int, rules.split(","))) * unfold
+    n = len(data)
+
+    dots = [0] * (n + 1)
+    for i, cell in enumerate(data):
+        dots[i + 1] = dots[i] + (cell == DOT)
+
+    # No groups left: valid only if no '#' remains
+    ways = [0] * (n + 1)
+    ways[n] = 1
+    for i in range(n - 1, -1, -1):
+        ways[i] = ways[i + 1] if data[i] != HASH else 0
+
+    for k in reversed(groups):
+        current = [0] * (n + 1)
+        for i in range(n - k, -1, -1):
+            total = current[i + 1] if data[i] != HASH else 0
+            end = i + k
+            if dots[end] == dots[i]:
+                if end == n:
+                    total += ways[n]
+                elif data[end] != HASH:
+                    total += ways[end + 1]
+            current[i] = total
+        ways = current
+
+    return ways[0]
+
+
+def _count_rows(rows, unfold):
+    return [count_combinations(data["row"], data["rules"], unfold) for data in rows]
+
+
+def count_all(rows, unfold=1, workers=None):
+    """
+    Total arrangements over parsed rows.
+
+    With workers, the rows are split into chunks counted on a process pool.
+    """
+    if not workers:
+        return sum(_count_rows(rows, unfold))
+    chunk = -(-len(rows) // workers)
+    chunks = [rows[i:i + chunk] for i in range(0, len(rows), chunk)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(sum(counts) for counts in executor.map(_count_rows, chunks, [unfold] * len(chunks)))
 
 
 def solvePartOne(input):
-    return sum(count_combinations(**data) for data in parse_rows(input))
+    return count_all(parse_rows(input))
 
 
 def solvePartTwo(input):
-    return sum(
-        count_combinations('?'.join([data["row"]] * 5), ','.join([data["rules"]] * 5))
-        for data in parse_rows(input)
-    )
+    return count_all(parse_rows(input), unfold=5)
@@ -44,3 +44,11 @@ def test_pass_solveOne():
 
 def test_pass_solveTwo():
     assert puzzle.solvePartTwo(puzzle.readInput()) == 1672318386674
+
+@pytest.mark.parametrize("unfold, expected", [(1, 4), (2, 32), (5, 16384)])
+def test_count_combinations_unfolded(unfold, expected):
+    assert puzzle.count_combinations(".??..??...?##.", "1,1,3", unfold) == expected
+
+def test_count_all_with_workers():
+    rows = puzzle.parse_rows(TEST_INPUT)
+    assert puzzle.count_all(rows, unfold=5, workers=2) == 525152
@@ -7,55 +7,62 @@ HORIZONTAL = 'H'
 class Puzzle:
     def __init__(self, data: np.ndarray):
         self.data = data
+        self._row_masks = None
+        self._column_masks = None
 
     @classmethod
     def from_string(cls, input_str: str) -> 'Puzzle':
         return cls(np.array([list(line) for line in input_str.strip().split('\n')]))
 
-    def find_reflections(self) -> List[Tuple[str, int]]:
-        """Find all reflections in the puzzle."""
-        reflections = []
-        rows, cols = self.data.shape
-
-        # Check for horizontal reflections
-        for i in range(1, rows):
-            top = self.data[:i][::-1]  # Reverse the top part
-            bottom = self.data[i:]
-            min_rows = min(len(top), len(bottom))
-            if np.array_equal(top[:min_rows], bottom[:min_rows]):
-                reflections.append((HORIZONTAL, i))
-
-        # Check for vertical reflections
-        for i in range(1, cols):
-            left = np.fliplr(self.data[:, :i])  # Reverse the left part
-            right = self.data[:, i:]
-            min_cols = min(left.shape[1], right.shape[1])
-            if np.array_equal(left[:, :min_cols], right[:, :min_cols]):
-                reflections.append((VERTICAL, i))
-
-        return reflections
+    @property
+    def row_masks(self) -> List[int]:
+        """Every row as an integer bitmask of its '#' cells, built once."""
+        if self._row_masks is None:
+            self._row_masks = _encode(self.data)
+        return self._row_masks
+
+    @property
+    def column_masks(self) -> List[int]:
+        if self._column_masks is None:
+            self._column_masks = _encode(self.data.T)
+        return self._column_masks
+
+    def find_reflections(self, smudges: int = 0) -> List[Tuple[str, int]]:
+        """
+        Find all reflections in the puzzle.
+
+        With smudges, a line only counts if the mirrored rows (or columns)
+        differ in exactly that many cells in total.
+        """
+        return ([(HORIZONTAL, i) for i in _mirror_lines(self.row_masks, smudges)] +
+                [(VERTICAL, i) for i in _mirror_lines(self.column_masks, smudges)])
 
     def find_smudged_reflection(self) -> Optional[Tuple[str, int]]:
-        """Find a new reflection after fixing a smudge."""
-        original_reflections = self.find_reflections()
-        rows, cols = self.data.shape
-
-        for i in range(rows):
-            for j in range(cols):
-                # Create a copy of the data and flip the bit at (i, j)
-                smudged_data = self.data.copy()
-                smudged_data[i, j] = '#' if smudged_data[i, j] == '.' else '.'
-
-                # Create a new Puzzle with the smudged data
-                smudged_puzzle = Puzzle(smudged_data)
-                new_reflections = smudged_puzzle.find_reflections()
-
-                # Check if we found a new reflection that's different from the original
-                for new_reflection in new_reflections:
-                    if new_reflection not in original_reflections:
-                        return new_reflection
-
-        return None
+        """
+        Find the reflection that appears after fixing a smudge.
+
+        That is the line whose mirrored pairs differ by exactly one cell, so
+        no cell has to be flipped and nothing is copied.
+        """
+        reflections = self.find_reflections(smudges=1)
+        return reflections[0] if reflections else None
+
+TO_BINARY = str.maketrans('#.', '10')
+
+def _encode(data: np.ndarray) -> List[int]:
+    return [int(''.join(line).translate(TO_BINARY), 2) for line in data]
+
+def _mirror_lines(masks: List[int], smudges: int):
+    """Lines between masks whose mirrored pairs differ in exactly smudges bits."""
+    count = len(masks)
+    for line in range(1, count):
+        differences = 0
+        for k in range(min(line, count - line)):
+            differences += (masks[line - 1 - k] ^ masks[line + k]).bit_count()
+            if differences > smudges:
+                break
+        if differences == smudges:
+            yield line
 
 def parse(input: str) -> List[Puzzle]:
     """Parse the input string into a list of Puzzle objects."""
@@ -65,12 +72,9 @@ def calculate_reflection_sum(puzzles: List[Puzzle], use_smudge: bool = False) ->
     """Calculate the sum of reflection values for all puzzles."""
     total = 0
     for puzzle in puzzles:
-        if use_smudge:
-            reflection = puzzle.find_smudged_reflection()
-        else:
-            reflections = puzzle.find_reflections()
-            reflection = reflections[0] if reflections else None
-        
+        reflections = puzzle.find_reflections(smudges=1 if use_smudge else 0)
+        reflection = reflections[0] if reflections else None
+
         if reflection:
             direction, index = reflection
             total += index if direction == VERTICAL else 100 * index
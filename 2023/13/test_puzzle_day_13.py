@@ -213,4 +213,10 @@ class TestSolutions:
 
     def test_solvePartTwo(self):
         result = puzzle.solvePartTwo(puzzle.readInput())
-        pytest.assume(result == 29276)
\ No newline at end of file
+        pytest.assume(result == 29276)
+
+def test_bitmask_encoding_and_batch(sample_patterns):
+    patterns = puzzle.parse("\n\n".join([sample_patterns.strip()] * 1000))
+    pytest.assume(patterns[0].row_masks[0] == 0b101100110)
+    pytest.assume(puzzle.calculate_reflection_sum(patterns) == 405 * 1000)
+    pytest.assume(puzzle.calculate_reflection_sum(patterns, use_smudge=True) == 400 * 1000)
@@ -25,72 +25,128 @@ def parse(input: str) -> np.ndarray:
     
     return grid
 
+EMPTY, ROUND, CUBE = 0, 1, 2
+NORTH, WEST, SOUTH, EAST = range(4)
+
+class TiltEngine:
+    """
+    Tilts the rounded rocks of a fixed layout of cube rocks.
+
+    Cube rocks never move, so for every direction each cell is assigned once
+    to the segment it slides along (the run of cells between two cube rocks)
+    and its rank counted from the end the rocks slide towards. A tilt is then
+    a bincount of rocks per segment followed by `rank < count[segment]`, all
+    on flat NumPy arrays, with no flipped or transposed copies of the grid.
+    """
+
+    def __init__(self, cubes: np.ndarray):
+        self.shape = cubes.shape
+        height, width = cubes.shape
+        index = np.arange(height * width).reshape(height, width)
+        # Views of the flat indices oriented so that rocks slide to row 0
+        views = {
+            NORTH: index,
+            WEST: index.T,
+            SOUTH: index[::-1, :],
+            EAST: index.T[::-1, :],
+        }
+        flat_cubes = cubes.ravel()
+        self.tables = [None] * 4
+        for direction, view in views.items():
+            self.tables[direction] = self._segments(flat_cubes[view], view)
+        self.weights = np.repeat(np.arange(height, 0, -1), width)
+
+    @staticmethod
+    def _segments(cubes: np.ndarray, view: np.ndarray):
+        """Segment id and rank of every cell when rocks slide towards row 0."""
+        rows, cols = cubes.shape
+        row_numbers = np.arange(rows)[:, None]
+        last_cube = np.maximum.accumulate(np.where(cubes, row_numbers, -1), axis=0)
+        rank = row_numbers - last_cube - 1
+        segment = np.cumsum(cubes, axis=0) + np.arange(cols) * (rows + 1)
+
+        # Cube cells get a segment that never holds rocks
+        dummy = cols * (rows + 1)
+        segment = np.where(cubes, dummy, segment)
+        rank = np.where(cubes, rows, rank)
+
+        flat_segment = np.empty(view.size, dtype=np.int64)
+        flat_rank = np.empty(view.size, dtype=np.int64)
+        flat_segment[view.ravel()] = segment.ravel()
+        flat_rank[view.ravel()] = rank.ravel()
+        return flat_segment, flat_rank, dummy + 1
+
+    def tilt(self, rocks: np.ndarray, direction: int) -> np.ndarray:
+        """Flat boolean rock mask after tilting in one direction."""
+        segment, rank, segments = self.tables[direction]
+        counts = np.bincount(segment[rocks], minlength=segments)
+        return rank < counts[segment]
+
+    def spin(self, rocks: np.ndarray) -> np.ndarray:
+        for direction in (NORTH, WEST, SOUTH, EAST):
+            rocks = self.tilt(rocks, direction)
+        return rocks
+
+    def load(self, rocks: np.ndarray) -> int:
+        return int(self.weights[rocks].sum())
+
+    def to_grid(self, rocks: np.ndarray, cubes: np.ndarray) -> np.ndarray:
+        grid = np.where(cubes, CUBE, EMPTY)
+        grid[rocks.reshape(self.shape)] = ROUND
+        return grid
+
+def _tilted(grid, directions):
+    cubes = grid == CUBE
+    engine = TiltEngine(cubes)
+    rocks = (grid == ROUND).ravel()
+    for direction in directions:
+        rocks = engine.tilt(rocks, direction)
+    return engine.to_grid(rocks, cubes)
+
 def tilt_north(grid):
-    height, width = grid.shape
-    for col in range(width):
-        for row in range(height):
-            if grid[row, col] == 1:  # If it's a rounded rock
-                new_row = row
-                while new_row > 0 and grid[new_row - 1, col] == 0:
-                    new_row -= 1
-                if new_row != row:
-                    grid[new_row, col] = 1
-                    grid[row, col] = 0
-    return grid
+    return _tilted(grid, [NORTH])
 
 def tilt_south(grid):
-    return np.flip(tilt_north(np.flip(grid, axis=0)), axis=0)
+    return _tilted(grid, [SOUTH])
 
 def tilt_west(grid):
-    return tilt_north(grid.T).T
+    return _tilted(grid, [WEST])
 
 def tilt_east(grid):
-    return tilt_south(grid.T).T
+    return _tilted(grid, [EAST])
 
 def cycle(grid):
-    grid = tilt_north(grid)
-    grid = tilt_west(grid)
-    grid = tilt_south(grid)
-    grid = tilt_east(grid)
-    return grid
+    return _tilted(grid, [NORTH, WEST, SOUTH, EAST])
 
 def calculate_total_load(grid):
     height, width = grid.shape
-    total_load = 0
-    for row in range(height):
-        load_for_row = height - row
-        rounded_rocks_in_row = np.sum(grid[row] == 1)
-        total_load += load_for_row * rounded_rocks_in_row
-    return total_load
+    return int(np.sum((grid == ROUND) * np.arange(height, 0, -1)[:, None]))
 
 def solve_part_one(input: str) -> int:
     grid = parse(input)
-    tilted_grid = tilt_north(grid)
-    
-    # Print the resulting tilted grid for debugging
-    print("Resulting Tilted Grid:")
-    print(tilted_grid)
-    
-    return calculate_total_load(tilted_grid)
+    return calculate_total_load(tilt_north(grid))
 
-def solve_part_two(input):
+def solve_part_two(input, target_cycles=1000000000):
     grid = parse(input)
+    engine = TiltEngine(grid == CUBE)
+    rocks = (grid == ROUND).ravel()
+
+    # Spin until a state repeats; the load after any later cycle is then
+    # read back from the loads recorded inside the loop.
     seen_states = {}
-    cycle_count = 0
-    target_cycles = 1000000000
-
-    while cycle_count < target_cycles:
-        grid_tuple = tuple(map(tuple, grid))
-        if grid_tuple in seen_states:
-            cycle_length = cycle_count - seen_states[grid_tuple]
-            remaining_cycles = (target_cycles - cycle_count) % cycle_length
-            for _ in range(remaining_cycles):
-                grid = cycle(grid)
+    loads = []
+    while True:
+        state = np.packbits(rocks).tobytes()
+        if state in seen_states:
+            loop_start = seen_states[state]
             break
-        seen_states[grid_tuple] = cycle_count
-        grid = cycle(grid)
-        cycle_count += 1
-
-    return calculate_total_load(grid)
-
+        seen_states[state] = len(loads)
+        loads.append(engine.load(rocks))
+        if len(loads) > target_cycles:
+            return loads[target_cycles]
+        rocks = engine.spin(rocks)
 
+    cycle_length = len(loads) - loop_start
+    if target_cycles < len(loads):
+        return loads[target_cycles]
+    return loads[loop_start + (target_cycles - loop_start) % cycle_length]
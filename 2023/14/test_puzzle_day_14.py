@@ -183,3 +183,22 @@ def test_solve_part_two_with_input():
     answer = puzzle.solve_part_two(input)
     print(f'Part Two : {answer}')
     # assert answer == 0  # Uncomment and update when you know the expected answer
+
+def test_tilt_engine_all_directions():
+    grid = puzzle.parse("""\
+O.#.
+.O..
+#..O
+.O.O""")
+    expected = {
+        puzzle.NORTH: "OO#O\n.O.O\n#...\n....",
+        puzzle.SOUTH: "..#.\nO...\n#O.O\n.O.O",
+        puzzle.WEST: "O.#.\nO...\n#O..\nOO..",
+        puzzle.EAST: ".O#.\n...O\n#..O\n..OO",
+    }
+    symbols = np.array(['.', 'O', '#'])
+    for direction, text in expected.items():
+        engine = puzzle.TiltEngine(grid == puzzle.CUBE)
+        rocks = engine.tilt((grid == puzzle.ROUND).ravel(), direction)
+        tilted = engine.to_grid(rocks, grid == puzzle.CUBE)
+        assert "\n".join("".join(row) for row in symbols[tilted]) == text
@@ -1,11 +1,8 @@
-import sys
 import re
-from functools import reduce
 import numpy as np
-import pandas as pd
 from typing import List, Tuple, Optional
 
-def hash(s: str) -> int:
+def holiday_hash(s: str) -> int:
     """
     Calculate the HASH value of a string.
     Each character is processed by:
@@ -15,12 +12,35 @@ def hash(s: str) -> int:
     """
     current = 0
     for c in s:
-        current += ord(c)
-        current *= 17
-        current %= 256
+        current = (current + ord(c)) * 17 % 256
     return current
 
 
+def hash_all(sequence: str) -> np.ndarray:
+    """
+    HASH of every comma-separated step at once.
+
+    The steps are laid out as rows of a zero-padded uint8 matrix and hashed
+    one column at a time, so the Python loop runs once per character
+    position rather than once per character.
+    """
+    data = np.frombuffer(sequence.replace('\n', '').encode(), dtype=np.uint8)
+    if not len(data):
+        return np.zeros(0, dtype=np.int64)
+    ends = np.flatnonzero(data == ord(','))
+    ends = np.append(ends, len(data))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    lengths = ends - starts
+
+    columns = np.arange(lengths.max())
+    present = columns < lengths[:, None]
+    matrix = np.where(present, data[np.minimum(starts[:, None] + columns, len(data) - 1)], 0)
+
+    current = np.zeros(len(starts), dtype=np.int64)
+    for column, mask in zip(matrix.T, present.T):
+        current = np.where(mask, (current + column) * 17 % 256, current)
+    return current
+
 def read_input():
     with open((__file__.rstrip("puzzle.py")+"input.txt"), 'r') as input_file:
         return input_file.read()
@@ -33,26 +53,25 @@ def parse_step(step: str) -> Tuple[str, str, Optional[int]]:
     return label, '=', int(focal_length)
 
 def process_sequence(sequence: str) -> List[List[Tuple[str, int]]]:
-    """Process sequence and return final state of boxes"""
-    boxes = [[] for _ in range(256)]
-    for step in sequence.split(','):
-        label, op, focal_length = parse_step(step)
-        box_num = hash(label)
-        
-        if op == '-':
-            # Remove lens with matching label if it exists
-            boxes[box_num] = [(l, f) for l, f in boxes[box_num] if l != label]
+    """
+    Process sequence and return final state of boxes.
+
+    Each box is an insertion-ordered dict of label -> focal length, so
+    replacing a lens keeps its slot and removing one is O(1). Label hashes
+    are computed together up front.
+    """
+    steps = [step for step in sequence.split(',') if step]
+    box_numbers = hash_all(re.sub(r'=\d+|-', '', ','.join(steps))).tolist() if steps else []
+
+    boxes = [{} for _ in range(256)]
+    for step, box_num in zip(steps, box_numbers):
+        if step[-1] == '-':
+            boxes[box_num].pop(step[:-1], None)
         else:
-            # Check if label exists
-            for i, (l, _) in enumerate(boxes[box_num]):
-                if l == label:
-                    boxes[box_num][i] = (label, focal_length)
-                    break
-            else:
-                # Label not found, append new lens
-                boxes[box_num].append((label, focal_length))
-    
-    return boxes
+            label, _, focal_length = step.partition('=')
+            boxes[box_num][label] = int(focal_length)
+
+    return [list(box.items()) for box in boxes]
 
 def calculate_focusing_power(boxes: List[List[Tuple[str, int]]]) -> int:
     """Calculate total focusing power of all lenses"""
@@ -68,8 +87,7 @@ def solve_part_one(input: str) -> int:
     Calculate the sum of HASH values for each step in the initialization sequence.
     Steps are comma-separated, ignoring newlines.
     """
-    steps = [step for step in input.replace('\n', '').split(',') if step]
-    return sum(hash(step) for step in steps)
+    return int(hash_all(input.strip().strip(',')).sum())
 
 def solve_part_two(input: str) -> int:
     """
@@ -11,13 +11,13 @@ def test_solve_part_one(capsys):
     assert answer == 505427
 
 def test_hash_empty_string():
-    assert puzzle.hash("") == 0
+    assert puzzle.holiday_hash("") == 0
 
 def test_hash_single_char():
-    assert puzzle.hash("H") == 200  # 72 * 17 % 256
+    assert puzzle.holiday_hash("H") == 200  # 72 * 17 % 256
 
 def test_hash_example():
-    assert puzzle.hash("HASH") == 52
+    assert puzzle.holiday_hash("HASH") == 52
 
 def test_hash_initialization_steps():
     test_cases = {
@@ -35,12 +35,12 @@ def test_hash_initialization_steps():
     }
     
     for input_str, expected in test_cases.items():
-        assert puzzle.hash(input_str) == expected, f"Failed for {input_str}"
+        assert puzzle.holiday_hash(input_str) == expected, f"Failed for {input_str}"
 
 def test_hash_full_sequence():
     sequence = "rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"
     steps = sequence.split(',')
-    total = sum(puzzle.hash(step) for step in steps)
+    total = sum(puzzle.holiday_hash(step) for step in steps)
     assert total == 1320
 
 def test_hash_algorithm_steps():
@@ -113,3 +113,8 @@ def test_solve_part_two_with_file(capsys):
     print(f'Part Two : {answer}')
     assert answer == 243747
 
+
+def test_hash_all_matches_scalar_hash():
+    sequence = "rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"
+    assert list(puzzle.hash_all(sequence)) == [puzzle.holiday_hash(step) for step in sequence.split(',')]
+    assert list(puzzle.hash_all("")) == []
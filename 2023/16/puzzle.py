@@ -3,6 +3,11 @@ import re
 from functools import reduce
 import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # repo root, for utils/
+from utils.helpers import Grid
 
 # Constants for directions
 DIRECTIONS = ['up', 'right', 'down', 'left']
@@ -30,55 +35,170 @@ def solve_part_two(input):
     best_start, max_energized = find_best_configuration(grid)
     return best_start, max_energized
 
-def calculate_energized_tiles(grid, start):
-    rows = len(grid)
-    cols = len(grid[0])
-    
-    visited = set()
-    energized = set()
-    stack = [start]  # Use a stack to manage the positions to visit
-
-    while stack:
-        row, col, direction = stack.pop()  # Get the current position and direction
-        beam_state = (row, col, direction)
-        
-        if beam_state in visited:
-            continue  # Skip if already visited
-        
-        visited.add(beam_state)
-
-        if is_valid(row, col, rows, cols):
-            energized.add((row, col))
-            
-            tile = grid[row][col]
-            next_direction = direction  # Default to the current direction
-            
-            # Determine the next direction based on the tile
-            if tile == '\\':
-                next_direction = {'right': 'down', 'left': 'up', 
-                                  'up': 'left', 'down': 'right'}[direction]
-            elif tile == '/':
-                next_direction = {'right': 'up', 'left': 'down', 
-                                  'up': 'right', 'down': 'left'}[direction]
-            elif tile == '|':
-                # If it's a splitter, add both up and down paths
-                stack.append((row - 1, col, 'up'))  # Move up
-                stack.append((row + 1, col, 'down'))  # Move down
-                continue  # Skip the rest of the processing for this tile
-            elif tile == '-':
-                # If it's a horizontal splitter, continue in the same direction
-                stack.append((row, col - 1, 'left'))  # Move left
-                stack.append((row, col + 1, 'right'))  # Move right
+UP, RIGHT, DOWN, LEFT = range(4)
+
+# Beams leaving a tile for each tile type and incoming direction
+EXITS = {
+    '.': {d: (d,) for d in range(4)},
+    '/': {UP: (RIGHT,), RIGHT: (UP,), DOWN: (LEFT,), LEFT: (DOWN,)},
+    '\\': {UP: (LEFT,), RIGHT: (DOWN,), DOWN: (RIGHT,), LEFT: (UP,)},
+    '|': {UP: (UP,), DOWN: (DOWN,), RIGHT: (UP, DOWN), LEFT: (UP, DOWN)},
+    '-': {LEFT: (LEFT,), RIGHT: (RIGHT,), UP: (LEFT, RIGHT), DOWN: (LEFT, RIGHT)},
+}
+
+class BeamEngine:
+    """
+    Energised tiles for any number of entry beams over one contraption.
+
+    A beam state is cell * 4 + direction, the beam entering that cell. For
+    every state the straight run up to the next mirror or splitter is
+    computed once, together with the tiles it covers as an int bitset.
+    A splitter hit on its flat side always sends the same two beams, so
+    the tiles energised from it do not depend on how it was reached; those
+    bitsets are computed once per splitter (per strongly connected group
+    of splitters, since beams can loop) and shared between all starts.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.rows = len(grid)
+        self.cols = len(grid[0])
+        # Rows are cut to the width of the first row; Grid pads shorter ones
+        self.tiles = Grid.from_rows([row[:self.cols] for row in grid]).data.decode()
+        self.steps = (-self.cols, 1, self.cols, -1)
+        self.runs = {}
+        self.reach = None
+
+    def next_state(self, cell, direction):
+        """State of the beam leaving cell in direction, or None off the grid."""
+        row, col = divmod(cell, self.cols)
+        row += (-1, 0, 1, 0)[direction]
+        col += (0, 1, 0, -1)[direction]
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return (row * self.cols + col) * 4 + direction
+        return None
+
+    def run(self, state):
+        """
+        Follow a beam straight until it turns or splits.
+
+        Returns (bits, cell, exits): the tiles covered including the last
+        one, the cell where it stopped and the directions leaving it
+        (empty when the beam left the grid).
+        """
+        if state in self.runs:
+            return self.runs[state]
+        cell, direction = divmod(state, 4)
+        step = self.steps[direction]
+        bits = 0
+        while True:
+            bits |= 1 << cell
+            exits = EXITS[self.tiles[cell]][direction]
+            if exits != (direction,):
+                break
+            following = self.next_state(cell, direction)
+            if following is None:
+                exits = ()
+                break
+            cell += step
+        self.runs[state] = (bits, cell, exits)
+        return self.runs[state]
+
+    def trace(self, state):
+        """
+        Follow a beam through mirrors until it splits or leaves the grid.
+
+        Returns (bits, splitter cell or None).
+        """
+        bits = 0
+        seen = set()
+        while state is not None and state not in seen:
+            seen.add(state)
+            run_bits, cell, exits = self.run(state)
+            bits |= run_bits
+            if len(exits) == 2:
+                return bits, cell
+            state = self.next_state(cell, exits[0]) if exits else None
+        return bits, None
+
+    def _splitter_reach(self):
+        """Tiles energised once each splitter fires, via Tarjan's SCC algorithm."""
+        splitters = [i for i, tile in enumerate(self.tiles) if tile in '|-']
+        own = {}
+        edges = {}
+        for cell in splitters:
+            flat = UP if self.tiles[cell] == '-' else LEFT
+            own[cell] = 1 << cell
+            edges[cell] = []
+            for direction in EXITS[self.tiles[cell]][flat]:
+                bits, target = self.trace(self.next_state(cell, direction))
+                own[cell] |= bits
+                if target is not None:
+                    edges[cell].append(target)
+
+        reach = {}
+        index = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        counter = 0
+        for root in splitters:
+            if root in index:
                 continue
-            
-            # Move to the next position based on the next direction
-            next_row, next_col = move(row, col, next_direction)
+            work = [(root, 0)]
+            while work:
+                node, edge_index = work.pop()
+                if edge_index == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack.add(node)
+                if edge_index < len(edges[node]):
+                    work.append((node, edge_index + 1))
+                    target = edges[node][edge_index]
+                    if target not in index:
+                        work.append((target, 0))
+                    elif target in on_stack:
+                        low[node] = min(low[node], index[target])
+                    continue
+                # All successors done: close the component if node is its root
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    bits = 0
+                    for member in component:
+                        bits |= own[member]
+                        for target in edges[member]:
+                            if target in reach:
+                                bits |= reach[target]
+                    for member in component:
+                        reach[member] = bits
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+        return reach
+
+    def energized(self, state):
+        """Number of tiles energised by a beam entering the given state."""
+        if self.reach is None:
+            self.reach = self._splitter_reach()
+        bits, splitter = self.trace(state)
+        if splitter is not None:
+            bits |= self.reach[splitter]
+        return bits.bit_count()
 
-            # Check bounds before adding the next position to the stack
-            if is_valid(next_row, next_col, rows, cols):
-                stack.append((next_row, next_col, next_direction))  # Add next position to stack
+    def start_state(self, start):
+        row, col, direction = start
+        return (row * self.cols + col) * 4 + DIRECTIONS.index(direction)
 
-    return len(energized)
+def calculate_energized_tiles(grid, start):
+    engine = BeamEngine(grid)
+    return engine.energized(engine.start_state(start))
 
 def process_tile(tile, direction):
     """Determine the next direction based on the current tile and direction."""
@@ -105,43 +225,35 @@ def is_valid(row, col, rows, cols):
     """Check if the position is within the grid bounds."""
     return 0 <= row < rows and 0 <= col < cols
 
-def find_best_configuration(grid):
-    rows = len(grid)
-    cols = len(grid[0])
-    max_energized = 0
-    best_start = None
-    memo = {}  # Dictionary to store results of previous configurations
-
-    def get_energized_count(start):
-        if start in memo:
-            return memo[start]  # Return cached result if available
-        energized_count = calculate_energized_tiles(grid, start)
-        memo[start] = energized_count  # Cache the result
-        return energized_count
-
-    # Check all edge tiles
-    for col in range(cols):  # Top row
-        energized_count = get_energized_count((0, col, 'down'))
-        if energized_count > max_energized:
-            max_energized = energized_count
-            best_start = (0, col, 'down')
-
-    for col in range(cols):  # Bottom row
-        energized_count = get_energized_count((rows - 1, col, 'up'))
-        if energized_count > max_energized:
-            max_energized = energized_count
-            best_start = (rows - 1, col, 'up')
-
-    for row in range(rows):  # Left column
-        energized_count = get_energized_count((row, 0, 'right'))
-        if energized_count > max_energized:
-            max_energized = energized_count
-            best_start = (row, 0, 'right')
-
-    for row in range(rows):  # Right column
-        energized_count = get_energized_count((row, cols - 1, 'left'))
-        if energized_count > max_energized:
-            max_energized = energized_count
-            best_start = (row, cols - 1, 'left')
-
-    return best_start, max_energized
\ No newline at end of file
+def edge_starts(rows, cols):
+    """Every entry beam along the edges, in the order they are compared."""
+    return (
+        [(0, col, 'down') for col in range(cols)]  # Top row
+        + [(rows - 1, col, 'up') for col in range(cols)]  # Bottom row
+        + [(row, 0, 'right') for row in range(rows)]  # Left column
+        + [(row, cols - 1, 'left') for row in range(rows)]  # Right column
+    )
+
+def _energized_for_starts(grid, starts):
+    engine = BeamEngine(grid)
+    return [engine.energized(engine.start_state(start)) for start in starts]
+
+def find_best_configuration(grid, workers=None):
+    """
+    Best edge entry and its energised tile count.
+
+    With workers, the edge starts are split into chunks evaluated on a
+    process pool, each worker building its own engine.
+    """
+    starts = edge_starts(len(grid), len(grid[0]))
+    if workers:
+        chunk = -(-len(starts) // workers)
+        chunks = [starts[i:i + chunk] for i in range(0, len(starts), chunk)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_energized_for_starts, [grid] * len(chunks), chunks)
+            counts = [count for result in results for count in result]
+    else:
+        counts = _energized_for_starts(grid, starts)
+
+    max_energized = max(counts)
+    return starts[counts.index(max_energized)], max_energized
@@ -151,3 +151,32 @@ def test_find_best_configuration():
     assert max_energized == expected_max_energized, f"Expected {expected_max_energized}, got {max_energized}"
 
 
+
+def test_find_best_configuration_process_pool():
+    grid = [
+        r".|...\....",
+        r"|.-.\.....",
+        r".....|-...",
+        r"........|.",
+        r"..........",
+        r".........\\",
+        r"..../.\\..",
+        r".-.-/..|..",
+        r".|....-|.\\",
+        r"..//.|...."
+    ]
+    assert puzzle.find_best_configuration(grid, workers=2) == ((0, 3, 'down'), 51)
+
+def test_beam_engine_shares_splitter_results():
+    grid = [
+        "..|..",
+        ".....",
+        "-...|",
+    ]
+    engine = puzzle.BeamEngine(grid)
+    # The first beam fires the '-' splitter, then both reach the '|' splitter
+    from_top = engine.energized(engine.start_state((0, 0, 'down')))
+    from_left = engine.energized(engine.start_state((2, 0, 'right')))
+    assert from_top == 9
+    assert from_left == 7
+    assert len(engine.reach) == 3
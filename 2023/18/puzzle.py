@@ -1,3 +1,4 @@
+import re
 
 
 def read_input():
@@ -26,91 +27,53 @@ def solve_part_one(input):
 
 
 def solve_part_two(input):
-    directions = parse_hex_instructions (input)
-    return calculate_lagoon_capacity(directions)
+    return calculate_lagoon_capacity(iter_hex_instructions(input))
 
 
-def calculate_lagoon_capacity(directions):
-    """Calculate the total area of the lagoon based on dug positions."""
-    # Initialize starting position
-    current_row, current_col = 0, 0  # Starting position (row, col)
-
-    # Define direction mappings
-    direction_map = {
-        "R": (0, 1),   # Move right (row, col)
-        "D": (1, 0),   # Move down
-        "L": (0, -1),  # Move left
-        "U": (-1, 0),  # Move up
-    }
+# Row and column step for each direction
+DIRECTIONS = {"R": (0, 1), "D": (1, 0), "L": (0, -1), "U": (-1, 0)}
+HEX_DIRECTIONS = "RDLU"
+HEX_CODE = re.compile(r"#([0-9a-fA-F]{5})([0-3])")
+
 
+def calculate_lagoon_capacity(directions):
+    """
+    Calculate the total area of the lagoon based on dug positions.
+
+    Shoelace in closed form per instruction: a vertical run of length d at
+    column c adds dy * d * c to the area, horizontal runs add nothing, and
+    the perimeter grows by d. The sign depends on the winding direction.
+    Pick's theorem then adds the trench itself.
+    Accepts any iterable of (direction, distance), including a generator.
+    """
+    current_col = 0
     perimeter = 0
     area = 0
 
     for direction, distance in directions:
-        dy, dx = direction_map[direction]  # Get the change in row and column
-        # Update the current position based on the direction and distance
-        for step in range(1, distance + 1):
-            new_col = current_col + dx * step
+        dy, dx = DIRECTIONS[direction]
+        area += dy * distance * current_col
+        current_col += dx * distance
+        perimeter += distance
 
-            area += new_col * dy
-            perimeter += 1  # Increment perimeter for each step taken
+    return abs(area) + perimeter // 2 + 1
 
-        # Update the current position after processing the entire distance
-        current_row += dy * distance
-        current_col += dx * distance
 
-    total_area = area + perimeter // 2 + 1  # Adjusting for overlaps or specific area calculation logic
+def decode_hex(hex_code):
+    """'#70c710' -> ('R', 461937): five hex digits of distance, then the direction."""
+    return HEX_DIRECTIONS[int(hex_code[6])], int(hex_code[1:6], 16)
 
-    return total_area
 
 def convert_hex_to_instructions(hex_codes):
-    instructions = []
-    for hex_code in hex_codes:
-        # Extract the distance and direction from the hex code
-        distance_hex = hex_code[1:6]  # First five digits
-        direction_hex = hex_code[6]    # Last digit
-        
-        # Convert distance from hexadecimal to decimal
-        distance = int(distance_hex, 16)
-        
-        # Determine the direction based on the last hex digit
-        direction = {
-            '0': 'R',
-            '1': 'D',
-            '2': 'L',
-            '3': 'U'
-        }[direction_hex]
-        
-        # Append the instruction to the list
-        instructions.append((direction, distance))
-    
-    return instructions
+    return [decode_hex(hex_code) for hex_code in hex_codes]
+
+
+def iter_hex_instructions(input_data):
+    """Stream (direction, distance) straight from the colour codes in the input."""
+    for match in HEX_CODE.finditer(input_data):
+        yield HEX_DIRECTIONS[int(match.group(2))], int(match.group(1), 16)
+
 
 def parse_hex_instructions(input_data):
     """Parse the input string into a list of tuples (direction, distance) based on hexadecimal codes."""
-    parsed_data = []
-    
-    for line in input_data.strip().split('\n'):
-        # Extract the hexadecimal color code from the line
-        parts = line.split()
-        hex_code = parts[-1].strip('()')  # Get the last part and remove parentheses
-        
-        # Extract the distance and direction from the hex code
-        distance_hex = hex_code[1:6]  # First five digits
-        direction_hex = hex_code[6]    # Last digit
-        
-        # Convert distance from hexadecimal to decimal
-        distance = int(distance_hex, 16)
-        
-        # Determine the direction based on the last hex digit
-        direction = {
-            '0': 'R',
-            '1': 'D',
-            '2': 'L',
-            '3': 'U'
-        }[direction_hex]
-        
-        # Append the instruction to the parsed data
-        parsed_data.append((direction, distance))
-    
-    return parsed_data
+    return list(iter_hex_instructions(input_data))
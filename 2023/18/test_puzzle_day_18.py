@@ -136,3 +136,14 @@ R 2 (#59c680)
     
     # Assert that the output matches the expected area
     assert area == expected_area, f"Expected {expected_area}, but got {area}"
+
+def test_streamed_hex_instructions():
+    stream = puzzle.iter_hex_instructions(TEST_INPUT)
+    assert next(stream) == ('R', 461937)
+    assert puzzle.calculate_lagoon_capacity(puzzle.iter_hex_instructions(TEST_INPUT)) == 952408144115
+
+def test_lagoon_capacity_either_winding():
+    clockwise = [('R', 2), ('D', 2), ('L', 2), ('U', 2)]
+    counter_clockwise = [('D', 2), ('R', 2), ('U', 2), ('L', 2)]
+    assert puzzle.calculate_lagoon_capacity(clockwise) == 9
+    assert puzzle.calculate_lagoon_capacity(counter_clockwise) == 9
@@ -1,5 +1,4 @@
-from collections import deque
-import ast
+import numpy as np
 
 def read_input():
     try:
@@ -9,52 +8,87 @@ def read_input():
         print("Input file not found.")
         return ""
 
+VARIABLES = {'x': 0, 'm': 1, 'a': 2, 's': 3}
+ACCEPT, REJECT = True, False
+
+
 class Pipeline:
     def __init__(self):
         self.workflows = {}
+        self._tree = None
 
     def register_workflow(self, name, rules):
         self.workflows[name] = rules
+        self._tree = None
+
+    @property
+    def tree(self):
+        """The workflows compiled into a decision tree, built on first use."""
+        if self._tree is None:
+            self._tree = compile_workflows(translate_workflows(self.workflows))
+        return self._tree
 
     def evaluate_part(self, part):
-        queue = deque(['in'])  # Start from the 'in' workflow
-
-        while queue:
-            current_workflow = queue.popleft()  # Get the next workflow to evaluate
-            rules = self.workflows.get(current_workflow, [])
-
-            for rule in rules:
-                # Parse the rule
-                if ':' in rule:
-                    condition, destination = rule.split(':', 1)
-                else:
-                    condition = None
-                    destination = rule
-
-                # Evaluate the condition if it exists
-                if condition:
-                    if evaluate_condition(condition, part):  # Use the custom evaluation function
-                        # If the destination is a workflow, enqueue that workflow
-                        if destination.strip() in self.workflows:
-                            queue.append(destination.strip())
-                            break  # Break to continue with the next workflow
-                        else:
-                            # If it's not a workflow, handle acceptance or rejection
-                            if destination.strip() == 'R':
-                                return False  # Part is rejected
-                            elif destination.strip() == 'A':
-                                return True  # Part is accepted
-                else:
-                    # If no condition exists, check for acceptance or rejection directly
-                    if destination.strip() == 'R':
-                        return False  # Part is rejected
-                    elif destination.strip() == 'A':
-                        return True  # Part is accepted
-                    elif destination.strip() in self.workflows:
-                        # If the destination is a workflow, enqueue that workflow
-                        queue.append(destination.strip())
-
-        return False  # If we exhaust the queue without accepting, the part is rejected
+        values = [part[var] for var in VARIABLES]
+        node = self.tree
+        while node.__class__ is tuple:
+            var, threshold, below, at_or_above = node
+            node = below if values[var] < threshold else at_or_above
+        return node
+
+
+def compile_workflows(workflows, start='in'):
+    """
+    Compile translated workflows into a decision tree of integer comparisons.
+
+    Inner nodes are (variable index, threshold, below, at_or_above) tuples
+    taking the `below` branch when the rating is under the threshold; 'x>n'
+    becomes a comparison against n + 1 with the branches swapped. Leaves are
+    ACCEPT or REJECT. Workflows reached from several places share one subtree.
+    """
+    compiled = {'A': ACCEPT, 'R': REJECT}
+
+    def build(name):
+        if name in compiled:
+            return compiled[name]
+        node = REJECT  # falling off the end of a workflow, or an unknown one
+        for condition in reversed(workflows.get(name, [])):
+            destination = build(condition['destiny'])
+            operator = condition['operator']
+            if not operator:
+                node = destination
+            elif operator == '<':
+                node = (VARIABLES[condition['varname']], condition['operand'], destination, node)
+            else:
+                node = (VARIABLES[condition['varname']], condition['operand'] + 1, node, destination)
+        compiled[name] = node
+        return node
+
+    return build(start)
+
+
+def classify(tree, ratings):
+    """
+    Accept or reject every row of an (n, 4) array of x, m, a, s ratings.
+
+    Rows are partitioned down the tree with one vectorised comparison per
+    node, so the Python work is per node rather than per part.
+    """
+    ratings = np.asarray(ratings)
+    accepted = np.zeros(len(ratings), dtype=bool)
+    pending = [(tree, np.arange(len(ratings)))]
+    while pending:
+        node, rows = pending.pop()
+        if not rows.size:
+            continue
+        if node.__class__ is not tuple:
+            accepted[rows] = node
+            continue
+        var, threshold, below, at_or_above = node
+        mask = ratings[rows, var] < threshold
+        pending.append((below, rows[mask]))
+        pending.append((at_or_above, rows[~mask]))
+    return accepted
 
 def parse(input_string):
     # Split the input into workflows and parts
@@ -83,13 +117,11 @@ def parse(input_string):
     return pipeline, parts
 
 def calculate_sum(pipeline, parts):
-    total_sum = 0
-
-    for part in parts:
-        if pipeline.evaluate_part(part):
-            total_sum += sum(part.values())  # Add the ratings to the total sum
-
-    return total_sum
+    if not parts:
+        return 0
+    ratings = np.array([[part[var] for var in VARIABLES] for part in parts])
+    accepted = classify(pipeline.tree, ratings)
+    return int(ratings[accepted].sum())
 
 def solve_part_one(input):
     pipeline, parts = parse(input)
@@ -101,73 +133,33 @@ def solve_part_two(input):
     translated_workflows = translate_workflows(workflows)
     return count_accepted_combinations(translated_workflows)
 
-def count_accepted_combinations(workflows):
-    # Initialize splits for each variable
-    splits = {
-        'x': {'low': 1, 'high': 4000},
-        'm': {'low': 1, 'high': 4000},
-        'a': {'low': 1, 'high': 4000},
-        's': {'low': 1, 'high': 4000}
-    }
-    total = 0
-
-    def process_workflow(wf_name, current_ranges):
-        nonlocal total
-        conditions = workflows[wf_name]
-
-        for condition in conditions:
-            # Process the condition
-            varname = condition['varname']
-            operator = condition['operator']
-            operand = condition['operand']
-            destiny = condition['destiny']
-
-            # Clone the current ranges for modification
-            new_ranges = clone_ranges(current_ranges)
-
-            print(f"wf_name: {wf_name} - new_ranges :{new_ranges}")
-
-            # Update the ranges based on the condition
-            if varname == 'x':
-                update_ranges(operator, operand, current_ranges['x'], new_ranges['x'])
-            elif varname == 'm':
-                update_ranges(operator, operand, current_ranges['m'], new_ranges['m'])
-            elif varname == 'a':
-                update_ranges(operator, operand, current_ranges['a'], new_ranges['a'])
-            elif varname == 's':
-                update_ranges(operator, operand, current_ranges['s'], new_ranges['s'])
-
-            # Check the destiny
-            if destiny == 'R':
-                continue  # Reject this path
-            elif destiny == 'A':
-                total += calc_arrangements(new_ranges)
-            else:
-                # Recur into the next workflow
-                process_workflow(destiny, new_ranges)
-
-    # Start processing from the 'in' workflow
-    process_workflow('in', splits)
+def count_accepted_combinations(workflows, low=1, high=4000):
+    """
+    Count rating combinations in [low, high]^4 that end up accepted.
 
+    Walks the compiled tree with half-open hyper-rectangles, splitting the
+    box at each comparison.
+    """
+    total = 0
+    pending = [(compile_workflows(workflows), ((low, high + 1),) * len(VARIABLES))]
+    while pending:
+        node, box = pending.pop()
+        if node.__class__ is not tuple:
+            if node:
+                total += calc_arrangements(box)
+            continue
+        var, threshold, below, at_or_above = node
+        start, stop = box[var]
+        if start < threshold:
+            pending.append((below, box[:var] + ((start, min(stop, threshold)),) + box[var + 1:]))
+        if threshold < stop:
+            pending.append((at_or_above, box[:var] + ((max(start, threshold), stop),) + box[var + 1:]))
     return total
 
-def clone_ranges(source):
-    return {key: {'low': value['low'], 'high': value['high']} for key, value in source.items()}
-
-def update_ranges(operator, operand, current_range, new_range):
-    if operator == "<":
-        new_range['high'] = operand - 1  # Set the new high value to one less than the operand
-        current_range['low'] = operand  # Set the current low value to the operand
-    elif operator == ">":
-        new_range['low'] = operand + 1  # Set the new low value to one more than the operand
-        current_range['high'] = operand  # Set the current high value to the operand
-
-def calc_arrangements(ranges):
+def calc_arrangements(box):
     result = 1
-    result *= ranges['x']['high'] - ranges['x']['low'] + 1
-    result *= ranges['m']['high'] - ranges['m']['low'] + 1
-    result *= ranges['a']['high'] - ranges['a']['low'] + 1
-    result *= ranges['s']['high'] - ranges['s']['low'] + 1
+    for start, stop in box:
+        result *= stop - start
     return result
 
 def parse_condition(condition_str):
@@ -199,13 +191,3 @@ def translate_workflows(original_workflows):
         translated_workflows[wf_name] = translated_conditions
 
     return translated_workflows
-
-def evaluate_condition(condition, part):
-    # Replace variable names with their values
-    for var in ['x', 'm', 'a', 's']:
-        condition = condition.replace(var, str(part[var]))
-
-    # Evaluate the condition safely
-    return eval(condition)  # Use eval here since we control the input format
-
-
@@ -131,4 +131,14 @@ def test_count_accepted_combinations(test_input, expected_count):
     workflows = pipeline.workflows
     translated_workflows = puzzle.translate_workflows(workflows)
     accepted_count = puzzle.count_accepted_combinations(translated_workflows)
-    assert accepted_count == expected_count
\ No newline at end of file
+    assert accepted_count == expected_count
+
+def test_compiled_tree_shape():
+    workflows = puzzle.translate_workflows({'in': ['x>10:A', 'm<5:R', 'A']})
+    assert puzzle.compile_workflows(workflows) == (0, 11, (1, 5, False, True), True)
+
+def test_classify_matches_evaluate_part(test_input):
+    pipeline, parts = puzzle.parse(test_input)
+    ratings = [[part[var] for var in 'xmas'] for part in parts]
+    expected = [pipeline.evaluate_part(part) for part in parts]
+    assert list(puzzle.classify(pipeline.tree, ratings)) == expected == [True, False, True, False, True]
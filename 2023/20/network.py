@@ -0,0 +1,127 @@
+from collections import deque
+
+BROADCAST, FLIP_FLOP, CONJUNCTION, SINK = 0, 1, 2, 3
+LOW, HIGH = 0, 1
+
+
+class PulseNetwork:
+    """
+    Pulse simulator compiled from the graph returned by parse_input.
+
+    Module names are mapped to integer ids once. Flip-flop state lives in a
+    bytearray and each conjunction remembers its inputs as one int bitmask,
+    with a precomputed mask of all inputs high. For every module and pulse
+    level the outgoing (destination, input bit, pulse) tuples are built up
+    front, so a press only extends a deque with ready-made tuples.
+    """
+
+    def __init__(self, graph):
+        names = list(graph)
+        for _, destinations in graph.values():
+            names.extend(d for d in destinations if d not in graph)
+        self.ids = {name: i for i, name in enumerate(dict.fromkeys(names))}
+        self.names = list(self.ids)
+        size = len(self.names)
+
+        kinds = {'%': FLIP_FLOP, '&': CONJUNCTION}
+        self.kind = bytearray(SINK for _ in range(size))
+        for name, (module_type, _) in graph.items():
+            self.kind[self.ids[name]] = kinds.get(module_type, BROADCAST)
+
+        # Give every input of a conjunction its own bit
+        self.inputs = [[] for _ in range(size)]
+        for name, (_, destinations) in graph.items():
+            for destination in destinations:
+                self.inputs[self.ids[destination]].append(self.ids[name])
+        self.all_high = [(1 << len(sources)) - 1 for sources in self.inputs]
+
+        self.outgoing = ([[] for _ in range(size)], [[] for _ in range(size)])
+        for name, (_, destinations) in graph.items():
+            source = self.ids[name]
+            for destination in destinations:
+                target = self.ids[destination]
+                bit = 1 << self.inputs[target].index(source)
+                for pulse in (LOW, HIGH):
+                    self.outgoing[pulse][source].append((target, bit, pulse))
+
+        self.broadcaster = self.ids['broadcaster']
+        self.reset()
+
+    def reset(self):
+        self.flip = bytearray(len(self.names))
+        self.memory = [0] * len(self.names)
+
+    def press(self, watch=()):
+        """
+        Push the button once.
+
+        Returns (low pulses, high pulses, ids in watch that sent a high pulse).
+        """
+        kind, flip, memory, all_high = self.kind, self.flip, self.memory, self.all_high
+        out_low, out_high = self.outgoing
+        sent_high = set()
+
+        counts = [0, 0]
+        queue = deque([(self.broadcaster, 0, LOW)])
+        while queue:
+            node, bit, pulse = queue.popleft()
+            counts[pulse] += 1
+            module = kind[node]
+            if module == FLIP_FLOP:
+                if pulse == HIGH:
+                    continue
+                flip[node] ^= 1
+                emit = flip[node]
+            elif module == CONJUNCTION:
+                if pulse == HIGH:
+                    memory[node] |= bit
+                else:
+                    memory[node] &= ~bit
+                emit = LOW if memory[node] == all_high[node] else HIGH
+            elif module == BROADCAST:
+                emit = pulse
+            else:
+                continue
+            if emit == HIGH:
+                if node in watch:
+                    sent_high.add(node)
+                queue.extend(out_high[node])
+            else:
+                queue.extend(out_low[node])
+        return counts[LOW], counts[HIGH], sent_high
+
+    def count_pulses(self, presses):
+        """Total (low, high) pulses over a number of presses."""
+        total_low = total_high = 0
+        for _ in range(presses):
+            low, high, _ = self.press()
+            total_low += low
+            total_high += high
+        return total_low, total_high
+
+    def find_periods(self, names, max_presses=1_000_000):
+        """
+        Press until every named module has sent a high pulse twice.
+
+        Returns {name: (first press, period)}, where period is the number
+        of presses between the first two high pulses.
+        """
+        watch = {self.ids[name] for name in names}
+        first, periods = {}, {}
+        for presses in range(1, max_presses + 1):
+            _, _, sent_high = self.press(watch)
+            for node in sent_high:
+                if node not in first:
+                    first[node] = presses
+                elif node not in periods:
+                    periods[node] = presses - first[node]
+            if len(periods) == len(watch):
+                break
+        else:
+            raise RuntimeError(f"No period found within {max_presses} presses")
+        return {self.names[node]: (first[node], periods[node]) for node in watch}
+
+    def feeders(self, name):
+        """Names of the modules that feed the single conjunction in front of name."""
+        (feeder,) = self.inputs[self.ids[name]]
+        return [self.names[source] for source in self.inputs[feeder]]
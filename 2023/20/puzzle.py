@@ -1,4 +1,4 @@
-from memory import Memory
+from network import PulseNetwork
 from collections import deque
 import collections
 import math
@@ -74,9 +74,9 @@ def push_button(graph, memory, initial_pulse=False):
     num_high = 0
 
     # Start processing from the broadcaster with the provided initial pulse
-    todo = [(None, 'broadcaster', initial_pulse)]  # Use the initial pulse state
+    todo = deque([(None, 'broadcaster', initial_pulse)])  # Use the initial pulse state
     while todo:
-        src, node, pulse = todo.pop(0)  # Get the current task
+        src, node, pulse = todo.popleft()  # Get the current task
         module_type, destinations = graph.get(node, (None, [])) # Get the module type and destinations
 
         if pulse:
@@ -107,11 +107,8 @@ def solve_part_one(input_data):
     # Use the parse_input function to convert the text into a graph structure
     graph, flops = parse_input(input_data)
 
-    memory = Memory()
-    memory.initialize(graph)  # Initialize memory based on the graph
-
     # Push the button 1000 times
-    total_low, total_high, state = push_button_n_times(graph, memory, 1000, initial_pulse=False)
+    total_low, total_high = PulseNetwork(graph).count_pulses(1000)
 
     # Calculate the product of low and high pulses
     product = total_low * total_high
@@ -119,97 +116,20 @@ def solve_part_one(input_data):
     # Return the product (or you can print it if needed)
     return product
 
-def decode_flip_flop_chain(graph, start_node):
-    bin = ''
-    m2 = start_node
-    while True:
-        # Get the module type and destinations for the current node
-        module_type, destinations = graph.get(m2, (None, []))
-        
-        # Append '1' or '0' based on the conditions
-        if module_type is not None:
-            bin = ('1' if len(destinations) == 2 or destinations[0] not in graph else '0') + bin
-        
-        # Find the next connected node(s)
-        next_nodes = [next_ for next_ in destinations if next_ in graph]
-        if not next_nodes:
-            break  # No further connections, exit the loop
-        m2 = next_nodes[0]  # Continue with the first next node
-    
-    return int(bin, 2)  # Convert binary string to integer
-
-def fewest_button_presses_to_rx(graph, memory):
-    res = []
-    _, destinations = graph.get('broadcaster', (None, [])) 
-    for destination in destinations:
-        # Use the new function to decode the flip-flop chain
-        res.append(decode_flip_flop_chain(graph, destination))
-
-    # Calculate and return the least common multiple of the integers
-    return math.lcm(*res) if res else None  # Return None if res is empty
-
-def get_binary_string_for_connected_node(graph, connected, flip_flops):
-    binary_string = ''
-    while True:
-        module_type, destinations = graph.get(connected, (None, []))
-        
-        # Early exit if there are no destinations
-        if not destinations:
-            break
-        
-        # Construct the binary string based on the conditions
-        binary_string = ('1' if len(destinations) == 2 or destinations[0] not in flip_flops else '0') + binary_string
-        
-        # Find all flip-flops in the destinations using the precomputed set
-        flip_flops_in_destinations = [dest for dest in destinations if dest in flip_flops]
-        if not flip_flops_in_destinations:
-            break
-        
-        connected = next((dest for dest in flip_flops_in_destinations), None)  # Get the first flip-flop or None
-    
-    return int(binary_string, 2)  # Convert binary string to integer
+def fewest_presses_until_low(graph, target='rx'):
+    """
+    Presses until target gets a low pulse, found by simulation.
+
+    target is fed by one conjunction, which sends low only once all of its
+    inputs have sent high in the same press. Each input fires on its own
+    cycle, so the answer is the LCM of their periods.
+    """
+    network = PulseNetwork(graph)
+    cycles = network.find_periods(network.feeders(target))
+    if any(first != period for first, period in cycles.values()):
+        raise ValueError(f"Inputs of {target} are not clean cycles: {cycles}")
+    return math.lcm(*(period for _, period in cycles.values()))
 
 def solve_part_two(input_data):
     graph,flip_flops = parse_input(input_data)
-    results = []
-    _, broadcaster_destinations = graph.get('broadcaster', (None, []))
-    
-    for connected in broadcaster_destinations:
-        binary_value = get_binary_string_for_connected_node(graph, connected, flip_flops)
-        results.append(binary_value)
-    
-    presses_needed = math.lcm(*results) if results else None
-
-    return presses_needed 
-
-def process_flip_flops(graph, flip_flops):
-    results = []
-    
-    for flip_flop in flip_flops:
-        state = 0  # Initialize an integer to represent the state
-        connected = flip_flop
-        
-        while True:
-            module_type, destinations = graph.get(connected, (None, []))
-            
-            # Early exit if there are no destinations
-            if not destinations:
-                break
-            
-            # Update the state based on the conditions
-            if len(destinations) == 2 or destinations[0] not in flip_flops:
-                state |= 1
-            else:
-                state &= ~1
-            
-            # Find all flip-flops in the destinations
-            flip_flops_in_destinations = [dest for dest in destinations if dest in flip_flops]
-            
-            # get the next flip-flop or None
-            connected = next((dest for dest in flip_flops_in_destinations), None)
-            if connected is None:
-                break  # Exit the loop if there are no flip-flops
-        
-        results.append(state)  # Append the final state as an integer
-    
-    return results 
\ No newline at end of file
+    return fewest_presses_until_low(graph)
@@ -1,5 +1,6 @@
 import puzzle
 from memory import Memory
+from network import PulseNetwork
 import pytest
 
 def test_parse_input():
@@ -279,4 +280,52 @@ def test_solve_part_two(capsys):
     input = puzzle.read_input()
     answer = puzzle.solve_part_two(input)
     print(f'Part Two : {answer}')
-    assert 240853834793347 == answer
\ No newline at end of file
+    assert 240853834793347 == answer
+
+
+@pytest.mark.parametrize("config, expected_low, expected_high", [
+    (
+        """
+        broadcaster -> a
+        %a -> inv, con
+        &inv -> b
+        %b -> con
+        &con -> output
+        """,
+        4250,
+        2750
+    ),
+    (
+        """
+        broadcaster -> a, b, c
+        %a -> b
+        %b -> c
+        %c -> inv
+        &inv -> a
+        """,
+        8000,
+        4000
+    )
+])
+def test_pulse_network_matches_memory_simulation(config, expected_low, expected_high):
+    graph, _ = puzzle.parse_input(config)
+    network = PulseNetwork(graph)
+    assert network.count_pulses(1000) == (expected_low, expected_high)
+
+def test_pulse_network_periods():
+    # Two flip-flop counters of different lengths feeding one conjunction before rx
+    config = """
+    broadcaster -> a, x
+    %a -> b, ca
+    %b -> ca
+    &ca -> da
+    &da -> hub
+    %x -> dx
+    &dx -> hub
+    &hub -> rx
+    """
+    graph, _ = puzzle.parse_input(config)
+    network = PulseNetwork(graph)
+    assert sorted(network.feeders('rx')) == ['da', 'dx']
+    periods = network.find_periods(['da', 'dx'])
+    assert {name: period for name, (_, period) in periods.items()} == {'da': 4, 'dx': 2}
@@ -1,7 +1,4 @@
-import math
-import fractions
-from functools import lru_cache
-from collections import deque
+import numpy as np
 
 
 def read_input():
@@ -12,48 +9,39 @@ def read_input():
 def parse(input):
     return [list(line.strip()) for line in input.strip().splitlines()]
 
-def neighbors(position, grid):
-    """Return valid neighboring positions for a given position."""
-    row, col = position
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # N, S, W, E
-    valid_neighbors = []
-
-    for dr, dc in directions:
-        new_row, new_col = row + dr, col + dc
-
-        # Check if the new position is within bounds and is a garden plot
-        if 0 <= new_row < len(grid) and 0 <= new_col < len(grid[0]):
-            if grid[new_row][new_col] == ".":
-                valid_neighbors.append((new_row, new_col))
-
-    return valid_neighbors
+def distance_map(grid, start, radius=0):
+    """
+    BFS step counts from start over a block of (2 * radius + 1)^2 copies of
+    the grid, with start placed in the centre copy. Unreachable cells and
+    rocks are -1.
+
+    Only the frontier is expanded on each step, as flat index arrays over a
+    rock-padded copy of the block, so no bounds checks are needed.
+    """
+    height, width = len(grid), len(grid[0])
+    tiles = 2 * radius + 1
+    open_cells = np.array([[cell != "#" for cell in row] for row in grid])
+    block = np.pad(np.tile(open_cells, (tiles, tiles)), 1)
+    stride = block.shape[1]
+    is_open = block.ravel()
+
+    dist = np.full(is_open.size, -1, dtype=np.int64)
+    row, col = start
+    frontier = np.array([(row + radius * height + 1) * stride + col + radius * width + 1])
+    offsets = np.array([-stride, stride, -1, 1])
+    steps = 0
+    while frontier.size:
+        dist[frontier] = steps
+        candidates = np.unique((frontier[:, None] + offsets).ravel())
+        frontier = candidates[is_open[candidates] & (dist[candidates] < 0)]
+        steps += 1
+    return dist.reshape(block.shape)[1:-1, 1:-1]
 
 
 def count_reachable_positions(grid, start_position, total_steps):
-    """Perform BFS to find all reachable positions after a given number of steps."""
-    queue = deque([start_position])
-    reachable_positions = set()
-    visited = set()  # Track visited positions
-
-    for t in range(total_steps + 1):
-        visit_next = set()
-        for _ in range(len(queue)):
-            current_row, current_col = queue.popleft()
-            visited.add((current_row, current_col))
-
-            # Add to reachable positions if the step count is even
-            if t % 2 == 0:
-                reachable_positions.add((current_row, current_col))
-
-            # Explore the four possible directions
-            for new_row, new_col in neighbors((current_row, current_col), grid):
-                new_position = (new_row, new_col)
-                if new_position not in visited:
-                    visit_next.add(new_position)
-
-        queue.extend(visit_next)
-
-    return len(reachable_positions)
+    """Count the positions reached after an even number of steps, up to total_steps."""
+    dist = distance_map(grid, start_position)
+    return int(np.count_nonzero((dist >= 0) & (dist <= total_steps) & (dist % 2 == 0)))
 
 
 def solve_part_one(input):
@@ -71,62 +59,121 @@ def find_start_position(garden_map):
     return None
 
 
+def count_in_reach(dist, steps):
+    """Cells that can be stood on after exactly steps steps."""
+    return int(np.count_nonzero((dist >= 0) & (dist <= steps) & ((steps - dist) % 2 == 0)))
+
+
+def _repeated_tiles(dist, steps, period, corner):
+    """
+    Plots reachable in the copies beyond an edge (or corner) tile of the block.
+
+    The m-th copy further out sees every distance grow by m * period. Beyond
+    an edge tile there is one copy per m, beyond a corner tile m + 1 copies.
+    """
+    dist = dist[dist >= 0]
+    slack = steps - dist
+    repeats = np.maximum(slack, 0) // period
+    if period % 2:
+        # Parity flips with every copy, so only every other m counts
+        parity = slack % 2
+        count = np.where(parity == 1, (repeats + 1) // 2, repeats // 2)
+        if corner:
+            return int(np.where(parity == 1, count * (count + 1), count * (count + 2)).sum())
+        return int(count.sum())
+    count = np.where(slack % 2 == 0, repeats, 0)
+    if corner:
+        return int((count * (count + 3) // 2).sum())
+    return int(count.sum())
+
+
+def _border_repeats(tiles, period):
+    """
+    Whether every border tile of the block is the tile next to it on the
+    inside shifted by period, i.e. whether the distances have settled into
+    the pattern that _repeated_tiles extends outwards.
+    """
+    def shifted(outer, inner):
+        return np.array_equal(outer, np.where(inner >= 0, inner + period, -1))
+
+    return (shifted(tiles[0], tiles[1]) and shifted(tiles[-1], tiles[-2])
+            and shifted(tiles[:, 0], tiles[:, 1]) and shifted(tiles[:, -1], tiles[:, -2]))
+
+
+def count_tiled(grid, steps, radius=3):
+    """
+    Count plots reachable in exactly steps steps on the infinite tiled garden.
+
+    One BFS over a (2 * radius + 1)^2 block of tiles gives the distance map
+    of every tile type: the centre, the four edge tiles and the four corner
+    tiles. Tiles inside the block are counted directly. Tiles further out
+    repeat an edge or corner tile shifted by a multiple of the grid size,
+    so they are summed in closed form per cell. The block grows until its
+    border tiles do repeat that way. Non-square grids, or step counts that
+    stay inside the block, grow the block until it holds the whole diamond
+    instead.
+    """
+    height, width = len(grid), len(grid[0])
+    start = find_start_position(grid)
+    while True:
+        if height != width or steps < radius * height:
+            radius = max(radius, steps // min(height, width) + 1)
+            return count_in_reach(distance_map(grid, start, radius), steps)
+        tiles = 2 * radius + 1
+        dist = distance_map(grid, start, radius)
+        dist = dist.reshape(tiles, height, tiles, width).swapaxes(1, 2)
+        if _border_repeats(dist, height):
+            break
+        radius += 1
+
+    total = 0
+    for ti in range(tiles):
+        for tj in range(tiles):
+            tile = dist[ti, tj]
+            total += count_in_reach(tile, steps)
+            edges = (ti in (0, tiles - 1)) + (tj in (0, tiles - 1))
+            if edges:
+                total += _repeated_tiles(tile, steps, height, corner=edges == 2)
+    return total
+
+
+def has_clear_diamond(grid):
+    """Whether the cells half a grid away from the centred start are reached in a straight line."""
+    size = len(grid)
+    start = find_start_position(grid)
+    if len(grid[0]) != size or not size & 1 or start != (size // 2, size // 2):
+        return False
+    dist = distance_map(grid, start)
+    half = size // 2
+    for offset in range(half + 1):
+        for row, col in ((offset, half + offset), (offset, half - offset),
+                         (size - 1 - offset, half + offset), (size - 1 - offset, half - offset)):
+            if dist[row, col] != half:
+                return False
+    return True
+
+
+def count_quadratic(grid, steps):
+    """
+    Count reachable plots by fitting a quadratic in steps // size.
+
+    For a square grid with a clear diamond around a centred start, the
+    count at size * n + steps % size steps is a quadratic in n, so three
+    samples inside a 7x7 block of tiles pin it down.
+    """
+    size = len(grid)
+    remainder, n = steps % size, steps // size
+    dist = distance_map(grid, find_start_position(grid), radius=3)
+    a0, a1, a2 = (count_in_reach(dist, remainder + k * size) for k in range(3))
+    return a0 + n * (a1 - a0) + n * (n - 1) // 2 * (a2 - 2 * a1 + a0)
+
+
 def solve_two(grid, n_steps=None):
     if n_steps is None:
         n_steps = 26501365
-
-    shape = (len(grid), len(grid[0]))
-    start = find_start_position(grid)
-    grid_tuple = tuple(tuple(row) for row in grid)
-
-    @lru_cache(maxsize=None)
-    def calculate_reachable_plots(n_steps, start_pos):
-        visit = {start_pos}
-        visited = set()
-        reachable = set()
-        odd = n_steps & 1
-
-        reachable_positions = count_reachable_positions(grid_tuple, start_pos, n_steps)
-
-        for t in range(n_steps + 1):
-            visit_next = set()
-            while visit:
-                i, j = visit.pop()
-                visited.add((i, j))
-                if t & 1 == odd:
-                    reachable.add((i, j))
-                for di, dj in [(-1, 0), (+1, 0), (0, -1), (0, +1)]:
-                    i_next, j_next = i + di, j + dj
-                    if grid_tuple[i_next % shape[0]][j_next % shape[1]] != '#':
-                        if (i_next, j_next) not in visited:
-                            visit_next.add((i_next, j_next))
-            visit = visit_next
-
-        return frozenset(reachable)
-
-    def verify_diamond_pattern():
-        reachable = calculate_reachable_plots(shape[0] // 2, start)
-        i, j = 0, shape[0] // 2
-        for di, dj in [(+1, +1), (+1, -1), (-1, -1), (-1, +1)]:
-            for _ in range(shape[0] // 2):
-                i += di
-                j += dj
-                if (i, j) not in reachable:
-                    return False
-        return True
-
-    def is_special_case(n_steps):
-        return (shape[0] == shape[1] and 
-                shape[0] & 1 and 
-                (n_steps - shape[0] // 2) % shape[0] == 0 and 
-                verify_diamond_pattern())
-
-    def process_steps(n_steps):
-        if is_special_case(n_steps):
-            return "Special case handling needed"
-        return len(calculate_reachable_plots(n_steps, start))
-
-    return process_steps(n_steps)
+    if len(grid) == len(grid[0]) and n_steps % len(grid) == len(grid) // 2 and has_clear_diamond(grid):
+        return count_quadratic(grid, n_steps)
+    return count_tiled(grid, n_steps)
 
 
 def solve_part_two(input):
@@ -134,4 +134,17 @@ def test_solve_part_two(capsys):
     input = puzzle.read_input()
     answer = puzzle.solve_part_two(input)
     print(f'Part Two : {answer}')
-    assert Fraction(632421652138917, 1) == answer
\ No newline at end of file
+    assert Fraction(632421652138917, 1) == answer
+
+def test_tile_sum_matches_quadratic_fit():
+    garden_map = puzzle.parse(puzzle.read_input())
+    assert puzzle.count_tiled(garden_map, 26501365) == puzzle.count_quadratic(garden_map, 26501365)
+
+@pytest.mark.parametrize("steps, expected_reachable", [
+    (53, 2562),
+    (200, 35518),
+])
+def test_count_tiled_grows_block_until_border_repeats(steps, expected_reachable):
+    # The border tiles of a 7x7 block don't repeat with period 5 yet here
+    garden_map = puzzle.parse(".#...\n.....\n...S.\n....#\n...#.")
+    assert puzzle.count_tiled(garden_map, steps) == expected_reachable
@@ -12,6 +12,10 @@ class Brick:
     end: Tuple[int, int, int]
     id: str = ''
 
+    def __post_init__(self):
+        self.start, self.end = (tuple(map(min, self.start, self.end)),
+                                tuple(map(max, self.start, self.end)))
+
     def get_positions(self) -> List[Tuple[int, int, int]]:
         positions = []
         x1, y1, z1 = self.start
@@ -24,71 +28,52 @@ class Brick:
 
 class BrickStack:
     def __init__(self, bricks: List[Brick]):
-        self.bricks = sorted(bricks, key=lambda b: min(b.start[2], b.end[2]))
-        self.space = {}  # (x,y,z) -> brick_id
+        self.bricks = sorted(bricks, key=lambda b: b.start[2])
         self.supports = defaultdict(set)  # brick_id -> set of bricks it supports
         self.supported_by = defaultdict(set)  # brick_id -> set of bricks supporting it
         self.brick_map = {b.id: b for b in bricks}  # For easy brick lookup
-        
+
         self.settle_bricks()
 
     def settle_bricks(self):
-        """Settle all bricks and establish support relationships."""
-        self.space.clear()
+        """
+        Drop bricks in order of their lowest z onto a heightmap.
+
+        Every (x, y) column keeps the z of its topmost cube and the index of
+        the brick that cube belongs to, so a brick lands one above the
+        highest column under its footprint and is supported by the bricks
+        owning columns at exactly that height.
+        """
         self.supports.clear()
         self.supported_by.clear()
-        
-        for brick in self.bricks:
-            # Find lowest possible z position for this brick
-            drop_z = self._get_drop_height(brick)
-            
-            # Calculate offset to move brick down
-            z_offset = min(brick.start[2], brick.end[2]) - drop_z
-            
-            # Update brick position
-            brick.start = (brick.start[0], brick.start[1], brick.start[2] - z_offset)
-            brick.end = (brick.end[0], brick.end[1], brick.end[2] - z_offset)
-            
-            # Place brick and update support relationships
-            self._place_brick(brick)
+        self.supporters = []  # brick index -> indices of the bricks under it
 
-    def _get_drop_height(self, brick: Brick) -> int:
-        """Find the lowest possible z position for a brick."""
-        positions = brick.get_positions()
-        lowest_points = {(x, y) for x, y, z in positions}
-        
-        max_obstacle_height = 0
-        for x, y in lowest_points:
-            z = min(brick.start[2], brick.end[2])
-            while z > 1:
-                z -= 1
-                if (x, y, z) in self.space:
-                    max_obstacle_height = max(max_obstacle_height, z)
-                    break
-        
-        return max_obstacle_height + 1
+        width = max((b.end[0] for b in self.bricks), default=-1) + 1
+        depth = max((b.end[1] for b in self.bricks), default=-1) + 1
+        heights = [[(0, -1)] * width for _ in range(depth)]  # [y][x] -> (top z, brick index)
 
-    def _place_brick(self, brick: Brick):
-        """Place brick in space and update support relationships."""
-        positions = brick.get_positions()
-        
-        # Find supporting bricks
-        supporters = set()
-        lowest_z = min(brick.start[2], brick.end[2])
-        for x, y, z in positions:
-            if z == lowest_z:  # Check position below
-                below_pos = (x, y, z-1)
-                if below_pos in self.space:
-                    supporters.add(self.space[below_pos])
-        
-        # Update support relationships
-        for supporter_id in supporters:
-            self.supports[supporter_id].add(brick.id)
-            self.supported_by[brick.id].add(supporter_id)
-        
-        # Place brick in space
-        for pos in positions:
-            self.space[pos] = brick.id
+        for index, brick in enumerate(self.bricks):
+            (x1, y1, z1), (x2, y2, z2) = brick.start, brick.end
+            columns = [(x, y) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1)]
+            rest = max(heights[y][x][0] for x, y in columns)
+            supporters = sorted({heights[y][x][1] for x, y in columns if heights[y][x][0] == rest and rest})
+
+            z_offset = z1 - rest - 1
+            brick.start = (x1, y1, z1 - z_offset)
+            brick.end = (x2, y2, z2 - z_offset)
+            new_top = z2 - z_offset
+            for x, y in columns:
+                heights[y][x] = (new_top, index)
+
+            self.supporters.append(supporters)
+            for supporter in supporters:
+                self.supports[self.bricks[supporter].id].add(brick.id)
+                self.supported_by[brick.id].add(self.bricks[supporter].id)
+
+    def find_removable_bricks(self) -> List[str]:
+        """Bricks whose removal leaves every brick they support with another supporter."""
+        return [brick.id for brick in self.bricks
+                if all(len(self.supported_by[above]) > 1 for above in self.supports[brick.id])]
 
     def would_fall(self, removed_brick: str, already_falling: Set[str] = None) -> Set[str]:
         """
@@ -119,19 +104,70 @@ class BrickStack:
         
         return falling
 
+    def dominator_tree(self) -> List[int]:
+        """
+        Immediate dominators of the support DAG, rooted at the ground.
+
+        The ground gets index len(self.bricks). A brick's immediate dominator
+        is the lowest common ancestor of its supporters in the tree built so
+        far; settling order is a topological order, so every supporter is
+        already placed. Ancestors are found by binary lifting.
+        """
+        ground = len(self.bricks)
+        idom = [ground] * (ground + 1)
+        depth = [0] * (ground + 1)
+        up = [[ground] * (ground + 1)]  # up[k][v] is the 2**k-th ancestor of v
+
+        def lowest_common_ancestor(a, b):
+            if depth[a] < depth[b]:
+                a, b = b, a
+            diff = depth[a] - depth[b]
+            k = 0
+            while diff:
+                if diff & 1:
+                    a = up[k][a]
+                diff >>= 1
+                k += 1
+            if a == b:
+                return a
+            for k in range(len(up) - 1, -1, -1):
+                if up[k][a] != up[k][b]:
+                    a, b = up[k][a], up[k][b]
+            return up[0][a]
+
+        for index, supporters in enumerate(self.supporters):
+            if supporters:
+                parent = supporters[0]
+                for supporter in supporters[1:]:
+                    parent = lowest_common_ancestor(parent, supporter)
+            else:
+                parent = ground
+            idom[index] = parent
+            depth[index] = depth[parent] + 1
+            up[0][index] = parent
+            for k in range(1, len(up)):
+                up[k][index] = up[k - 1][up[k - 1][index]]
+            if depth[index] >= 1 << len(up):
+                # Add a level; only bricks placed so far need filling in
+                level = [up[-1][up[-1][v]] for v in range(ground + 1)]
+                up.append(level)
+        return idom
+
     def calculate_chain_reactions(self) -> Dict[str, int]:
         """
         Calculate how many other bricks would fall for each possible brick removal.
         Returns a dictionary mapping brick ID to number of other bricks that would fall.
+
+        A brick falls exactly when every path down to the ground passes the
+        removed brick, i.e. when the removed brick dominates it, so the answer
+        is the size of the brick's dominator subtree minus itself.
         """
-        chain_reactions = {}
-        
-        for brick in self.bricks:
-            falling = self.would_fall(brick.id)
-            chain_reactions[brick.id] = len(falling)
-            
-        return chain_reactions
-    
+        idom = self.dominator_tree()
+        subtree = [1] * len(idom)
+        for index in range(len(self.bricks) - 1, -1, -1):
+            subtree[idom[index]] += subtree[index]
+        return {brick.id: subtree[index] - 1 for index, brick in enumerate(self.bricks)}
+
 def parse_bricks(input_str: str) -> List[Brick]:
 
     bricks = []
@@ -113,3 +113,10 @@ def test_solve_part_two(capsys):
     answer = puzzle.solve_part_two(input)
     print(f"Part Two : {answer}")
     assert 86556 == answer
+
+
+def test_chain_reactions_match_would_fall():
+    stack = puzzle.BrickStack(puzzle.parse_bricks(puzzle.read_input()))
+    chain_reactions = stack.calculate_chain_reactions()
+    for brick in stack.bricks[::25]:
+        assert chain_reactions[brick.id] == len(stack.would_fall(brick.id))
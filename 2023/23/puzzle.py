@@ -2,6 +2,9 @@ from typing import Dict, Set, Tuple, List, DefaultDict
 from collections import defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+import os
+
 def read_input():
     with open((__file__.rstrip("puzzle.py") + "input.txt"), "r") as input_file:
         return input_file.read()
@@ -103,26 +106,7 @@ class HikingTrail:
         without revisiting any tiles and following slope rules.
         Returns -1 if no valid path exists.
         """
-        exploration_stack = [(self.start, 0, frozenset([self.start]))]  # (current node, current path length, visited set)
-        max_length = float('-inf')  # Track the maximum path length found
-
-        while exploration_stack:
-            current, path_length, visited = exploration_stack.pop()
-
-            # Update max_length if we reach the end
-            if current == self.end:
-                max_length = max(max_length, path_length)
-
-            self.add_neighbors_to_stack(current, path_length, visited, exploration_stack)
-
-        return max_length if max_length != float('-inf') else -1
-
-    def add_neighbors_to_stack(self, current: Node, path_length: int, visited: frozenset, stack: list):
-        """Add valid neighbors to the exploration stack."""
-        for next_node, distance in sorted(self.connections[current].items()):
-            if next_node not in visited:
-                new_visited = visited | frozenset([next_node])  # Create a new frozenset for visited
-                stack.append((next_node, path_length + distance, new_visited))
+        return build_collapsed_graph(self.grid, ignore_slopes).find_longest_path()
 
     def print_path(self, best_path: List[Tuple[int, int]]):
         """Print the grid with the path followed."""
@@ -205,10 +189,11 @@ class Node:
         return self.row == other.row and self.col == other.col
 
 class CollapsedGraph:
-    def __init__(self):
+    def __init__(self, directed: bool = True):
         self.edges: Dict[Node, Dict[Node, int]] = defaultdict(dict)
         self.start: Node = None
         self.end: Node = None
+        self.directed = directed
 
     def add_edge(self, from_node: Node, to_node: Node, weight: int):
         """Add a weighted edge between nodes."""
@@ -218,39 +203,194 @@ class CollapsedGraph:
         """Get all neighboring nodes and their weights."""
         return self.edges[node]
 
-    def find_longest_path(self) -> int:
-        """Find the longest path from start to end using iterative DFS."""
-        # Stack entries: (current_node, path_length, visited_nodes)
-        stack = [(self.start, 0, frozenset([self.start]))]
-        max_length = float('-inf')
-        
+    def compile(self) -> "JunctionGraph":
+        """Re-index the junctions to small integers for the bitmask search."""
+        nodes = {self.start, self.end}
+        for node, neighbors in self.edges.items():
+            nodes.add(node)
+            nodes.update(neighbors)
+        ids = {node: i for i, node in enumerate(sorted(nodes, key=lambda n: (n.row, n.col)))}
+
+        weights = [[0] * len(ids) for _ in ids]
+        for node, neighbors in self.edges.items():
+            for next_node, weight in neighbors.items():
+                weights[ids[node]][ids[next_node]] = weight
+
+        graph = JunctionGraph(weights, ids[self.start], ids[self.end])
+        if not self.directed:
+            graph.prune_perimeter()
+        return graph
+
+    def find_longest_path(self, parallel: bool = False) -> int:
+        """Find the longest path from start to end without revisiting a junction."""
+        graph = self.compile()
+        return graph.longest_path_parallel() if parallel else graph.longest_path()
+
+
+class JunctionGraph:
+    """
+    Junction graph with integer node ids and an adjacency matrix of weights.
+
+    The longest path search keeps the visited set as an int bitmask and
+    prunes any branch whose length plus the best possible remaining gain
+    (the heaviest edge into every unvisited junction) cannot beat the best
+    path found so far.
+    """
+
+    def __init__(self, weights: List[List[int]], start: int, end: int):
+        self.weights = weights
+        self.size = len(weights)
+        self.start = start
+        self.end = end
+
+    def neighbors(self, node: int) -> List[Tuple[int, int]]:
+        row = self.weights[node]
+        return [(next_node, weight) for next_node, weight in enumerate(row) if weight]
+
+    def prune_perimeter(self):
+        """
+        Make the edges around the outer ring one-way, towards the exit.
+
+        In the undirected maze the junctions form a planar grid whose outer
+        ring has junctions of degree 3 or less. Walking along that ring away
+        from the exit walls off the exit, so those moves can never be part
+        of a complete path. Mazes that don't have that shape are left alone.
+        """
+        ring = self._outer_ring()
+        if ring is None:
+            return
+        ring |= {self.start, self.end}
+
+        # Distance to the exit measured along the ring only
+        distance = {self.end: 0}
+        queue = deque([self.end])
+        while queue:
+            node = queue.popleft()
+            for next_node, _ in self.neighbors(node):
+                if next_node in ring and next_node not in distance:
+                    distance[next_node] = distance[node] + 1
+                    queue.append(next_node)
+
+        for node in ring:
+            for next_node, _ in self.neighbors(node):
+                if next_node in ring and node in distance and next_node in distance:
+                    if distance[next_node] > distance[node]:
+                        self.weights[node][next_node] = 0
+
+    def _outer_ring(self):
+        """
+        The junctions on the outer ring of a grid-shaped maze, or None.
+
+        Apart from the entrance and exit, every junction must have degree 4
+        except for a single cycle of degree 2 and 3 junctions: the ring.
+        Anything else (dead ends, irregular junctions) means the degree
+        alone doesn't say which junctions are on the outside.
+        """
+        terminals = {self.start, self.end}
+        if any(len(self.neighbors(node)) != 1 for node in terminals):
+            return None
+        inner = [node for node in range(self.size) if node not in terminals]
+        ring = set()
+        for node in inner:
+            degree = len(self.neighbors(node))
+            if degree in (2, 3):
+                ring.add(node)
+            elif degree != 4:
+                return None
+        if not ring:
+            return None
+
+        for node in ring:
+            if sum(1 for next_node, _ in self.neighbors(node) if next_node in ring) != 2:
+                return None
+        seen = {next(iter(ring))}
+        stack = list(seen)
         while stack:
-            current, path_length, visited = stack.pop()
-            
-            if current == self.end:
-                max_length = max(max_length, path_length)
-                continue
-            
-            # Add all unvisited neighbors to the stack
-            # Sort by weight to try heavier paths first (potential optimization)
-            neighbors = sorted(
-                [(next_node, weight) for next_node, weight in self.edges[current].items()
-                 if next_node not in visited],
-                key=lambda x: x[1],
-                reverse=True
-            )
-            
-            for next_node, weight in neighbors:
-                new_visited = frozenset([*visited, next_node])
-                stack.append((next_node, path_length + weight, new_visited))
-        
-        return max_length if max_length != float('-inf') else -1
+            node = stack.pop()
+            for next_node, _ in self.neighbors(node):
+                if next_node in ring and next_node not in seen:
+                    seen.add(next_node)
+                    stack.append(next_node)
+        return ring if seen == ring else None
+
+    def _search_tables(self):
+        """Adjacency lists, per-node best entry weight and the effective target."""
+        adjacency = [self.neighbors(node) for node in range(self.size)]
+        best_entry = [
+            max((self.weights[other][node] for other in range(self.size)), default=0)
+            for node in range(self.size)
+        ]
+        # If the exit has a single way in, reaching that junction means
+        # walking straight to the exit, so it becomes the target.
+        target, bonus = self.end, 0
+        entries = [node for node in range(self.size) if self.weights[node][self.end]]
+        if len(entries) == 1 and entries[0] != self.start:
+            target, bonus = entries[0], self.weights[entries[0]][self.end]
+            best_entry[self.end] = 0
+        return adjacency, best_entry, target, bonus
+
+    def longest_path(self) -> int:
+        """Longest start to exit path, or -1 if the exit is unreachable."""
+        adjacency, best_entry, target, bonus = self._search_tables()
+        remaining = sum(best_entry) - best_entry[self.start]
+        best = _longest_from(adjacency, best_entry, target,
+                             self.start, 1 << self.start, 0, remaining)
+        return best + bonus if best >= 0 else -1
+
+    def longest_path_parallel(self, depth: int = 4, workers: int = None) -> int:
+        """Longest path with the first `depth` junction choices split across processes."""
+        adjacency, best_entry, target, bonus = self._search_tables()
+        remaining = sum(best_entry) - best_entry[self.start]
+
+        frontier = [(self.start, 1 << self.start, 0, remaining)]
+        finished = -1
+        for _ in range(depth):
+            expanded = []
+            for node, visited, length, left in frontier:
+                if node == target:
+                    finished = max(finished, length)
+                    continue
+                for next_node, weight in adjacency[node]:
+                    bit = 1 << next_node
+                    if not visited & bit:
+                        expanded.append((next_node, visited | bit, length + weight,
+                                         left - best_entry[next_node]))
+            frontier = expanded
+
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(_longest_from, adjacency, best_entry, target, *branch)
+                for branch in frontier
+            ]
+            best = max([finished] + [future.result() for future in futures])
+        return best + bonus if best >= 0 else -1
+
+
+def _longest_from(adjacency, best_entry, target, node, visited, length, remaining) -> int:
+    """Depth-first longest path to target from a partial path; -1 if unreachable."""
+    best = -1
+
+    def dfs(node, visited, length, remaining):
+        nonlocal best
+        if node == target:
+            if length > best:
+                best = length
+            return
+        if length + remaining <= best:
+            return
+        for next_node, weight in adjacency[node]:
+            bit = 1 << next_node
+            if not visited & bit:
+                dfs(next_node, visited | bit, length + weight, remaining - best_entry[next_node])
+
+    dfs(node, visited, length, remaining)
+    return best
 
 def build_collapsed_graph(grid: List[List[str]], ignore_slopes: bool = False) -> CollapsedGraph:
     """Build a graph with all passthrough nodes collapsed."""
     height = len(grid)
     width = len(grid[0])
-    graph = CollapsedGraph()
+    graph = CollapsedGraph(directed=not ignore_slopes)
     
     def get_neighbors(node: Node) -> List[Tuple[Node, int]]:
         """Get valid neighboring nodes and movement cost."""
@@ -312,7 +452,6 @@ def build_collapsed_graph(grid: List[List[str]], ignore_slopes: bool = False) ->
     
     # Find all junctions and build collapsed edges
     junctions = set()
-    processed = set()
     
     # First identify all junctions
     for row in range(height):
@@ -322,28 +461,20 @@ def build_collapsed_graph(grid: List[List[str]], ignore_slopes: bool = False) ->
                 if is_junction(node):
                     junctions.add(node)
     
-    # Then build edges between junctions
+    # Then build edges by walking out of every junction. With slopes the
+    # corridors are one-way, so each direction is only added when walked.
     for junction in junctions:
-        if junction in processed:
-            continue
-            
         for next_node, initial_dist in get_neighbors(junction):
-            if next_node not in processed:
-                end_node, additional_dist = follow_path(next_node, junction)
-                total_dist = initial_dist + additional_dist
-                
-                if end_node in junctions:
-                    graph.add_edge(junction, end_node, total_dist)
-                    graph.add_edge(end_node, junction, total_dist)
-        
-        processed.add(junction)
+            end_node, additional_dist = follow_path(next_node, junction)
+            if end_node in junctions and end_node != junction:
+                graph.add_edge(junction, end_node, initial_dist + additional_dist)
     
     return graph
 
-def solve(grid: List[List[str]], ignore_slopes: bool = False) -> int:
+def solve(grid: List[List[str]], ignore_slopes: bool = False, parallel: bool = False) -> int:
     """Find the longest possible path in the grid."""
     graph = build_collapsed_graph(grid, ignore_slopes)
-    return graph.find_longest_path()
+    return graph.find_longest_path(parallel=parallel)
 
 
 
@@ -1,6 +1,9 @@
 import dataclasses
+from fractions import Fraction
+from itertools import combinations
 from typing import List, Tuple, Optional
-from z3 import Solver, Int,sat
+
+import numpy as np
 
 def read_input():
     with open((__file__.rstrip("puzzle.py")+"input.txt"), 'r') as input_file:
@@ -95,25 +98,43 @@ def find_intersection_2d(h1: Hailstone, h2: Hailstone) -> tuple[float, float, fl
         
     return (x, y, t1)
 
-def count_collisions(hailstones: list[Hailstone], x_min: float, x_max: float, 
-                     y_min: float, y_max: float) -> int:
+def count_collisions(hailstones: list[Hailstone], x_min: float, x_max: float,
+                     y_min: float, y_max: float, block: int = 512) -> int:
     """
     Count number of hailstone pairs that collide within the given boundary.
+
+    Pairs are solved as p_i + v_i * t = p_j + v_j * s in blocks of rows
+    against every later hailstone with NumPy. The cross-product numerators
+    are computed exactly in int64, so only the final division is rounded.
     """
+    if len(hailstones) < 2:
+        return 0
+    px = np.array([h.position.x for h in hailstones], dtype=np.int64)
+    py = np.array([h.position.y for h in hailstones], dtype=np.int64)
+    vx = np.array([h.velocity.x for h in hailstones], dtype=np.int64)
+    vy = np.array([h.velocity.y for h in hailstones], dtype=np.int64)
+
     collision_count = 0
-    
-    for i in range(len(hailstones)):
-        for j in range(i + 1, len(hailstones)):
-            intersection = find_intersection_2d(hailstones[i], hailstones[j])
-            
-            if intersection is None:
-                continue
-                
-            x, y, _ = intersection
-            
-            if (x_min <= x <= x_max and y_min <= y <= y_max):
-                collision_count += 1
-                
+    for first in range(0, len(hailstones) - 1, block):
+        rows = slice(first, min(first + block, len(hailstones) - 1))
+        i = np.arange(len(hailstones))[rows, None]
+        dx = px[None, :] - px[rows, None]
+        dy = py[None, :] - py[rows, None]
+        det = vx[rows, None] * vy[None, :] - vy[rows, None] * vx[None, :]
+        t_num = dx * vy[None, :] - dy * vx[None, :]
+        s_num = dx * vy[rows, None] - dy * vx[rows, None]
+
+        valid = (np.arange(len(hailstones))[None, :] > i) & (det != 0)
+        safe_det = np.where(valid, det, 1)
+        # Both times must be in the future: numerators share the sign of det
+        valid &= (t_num * np.sign(safe_det) >= 0) & (s_num * np.sign(safe_det) >= 0)
+
+        t = t_num / safe_det
+        x = px[rows, None] + vx[rows, None] * t
+        y = py[rows, None] + vy[rows, None] * t
+        inside = (x_min <= x) & (x <= x_max) & (y_min <= y) & (y <= y_max)
+        collision_count += int(np.count_nonzero(valid & inside))
+
     return collision_count
 
 
@@ -121,64 +142,80 @@ def solve_part_one(input):
     hailstones = parse_hailstones(input)
     return count_collisions(hailstones, 200000000000000, 400000000000000, 200000000000000, 400000000000000)
 
+def _cross_matrix(d: Point3D) -> List[List[int]]:
+    """Matrix M with M @ a == a x d."""
+    return [[0, d.z, -d.y], [-d.z, 0, d.x], [d.y, -d.x, 0]]
+
+
+def _cross(a: Point3D, b: Point3D) -> Tuple[int, int, int]:
+    return (a.y * b.z - a.z * b.y, a.z * b.x - a.x * b.z, a.x * b.y - a.y * b.x)
+
+
+def _difference(a: Point3D, b: Point3D) -> Point3D:
+    return Point3D(a.x - b.x, a.y - b.y, a.z - b.z)
+
+
+def solve_linear(matrix: List[List[Fraction]], rhs: List[Fraction]) -> Optional[List[Fraction]]:
+    """Gauss-Jordan elimination over Fractions; None if the system is singular."""
+    size = len(matrix)
+    rows = [list(map(Fraction, row)) + [Fraction(value)] for row, value in zip(matrix, rhs)]
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if rows[r][col] != 0), None)
+        if pivot is None:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_row = rows[col]
+        for r in range(size):
+            factor = rows[r][col] / pivot_row[col]
+            if r != col and factor:
+                rows[r] = [a - factor * b for a, b in zip(rows[r], pivot_row)]
+    return [rows[r][size] / rows[r][r] for r in range(size)]
+
+
 def find_rock_trajectory(hailstones: List[Hailstone], max_samples: int = 5) -> Optional[Tuple[Point3D, Point3D]]:
     """
     Find initial rock position and velocity that intersects all hailstones.
-    Uses sampling to reduce problem size for large inputs.
+
+    A rock P + V t hits hailstone i exactly when (P - p_i) x (V - v_i) = 0.
+    The P x V term is shared by every hailstone, so subtracting the equations
+    of two hailstones leaves three linear equations in P and V. Two pairs
+    give a 6x6 system solved exactly over Fractions; pairs are drawn from the
+    first max_samples hailstones until the system is regular, and the
+    solution is then checked against every hailstone.
     """
-    # Sample a subset of hailstones for initial solving
-    sample_size = min(max_samples, len(hailstones))
-    sample_stones = hailstones[:sample_size]
-    
-    solver = Solver()
-    
-    # Rock position and velocity variables
-    rx, ry, rz = Int('rx'), Int('ry'), Int('rz')
-    rvx, rvy, rvz = Int('rvx'), Int('rvy'), Int('rvz')
-    
-    # Add equations for sampled hailstones
-    for i, h in enumerate(sample_stones):
-        t = Int(f't{i}')
-        solver.add(t >= 0)
-        
-        # Position equations at collision time
-        solver.add(rx + rvx * t == h.position.x + h.velocity.x * t)
-        solver.add(ry + rvy * t == h.position.y + h.velocity.y * t)
-        solver.add(rz + rvz * t == h.position.z + h.velocity.z * t)
-    
-    if solver.check() == sat:
-        model = solver.model()
-        position = Point3D(
-            model[rx].as_long(),
-            model[ry].as_long(),
-            model[rz].as_long()
-        )
-        velocity = Point3D(
-            model[rvx].as_long(),
-            model[rvy].as_long(),
-            model[rvz].as_long()
-        )
-        
-        # Verify solution against all hailstones
+    sample_stones = hailstones[:max(max_samples, 3)]
+    for h0, h1, h2 in combinations(sample_stones, 3):
+        matrix, rhs = [], []
+        for h in (h1, h2):
+            dv_rows = _cross_matrix(_difference(h0.velocity, h.velocity))
+            dp_rows = _cross_matrix(_difference(h0.position, h.position))
+            c0 = _cross(h0.position, h0.velocity)
+            c = _cross(h.position, h.velocity)
+            for k in range(3):
+                matrix.append([-a for a in dv_rows[k]] + dp_rows[k])
+                rhs.append(c[k] - c0[k])
+
+        solution = solve_linear(matrix, rhs)
+        if solution is None or any(value.denominator != 1 for value in solution):
+            continue
+        values = [int(value) for value in solution]
+        position, velocity = Point3D(*values[:3]), Point3D(*values[3:])
         if verify_solution(position, velocity, hailstones):
             return position, velocity
-    
+
     return None
 
 def will_collide(rock_pos: Point3D, rock_vel: Point3D, hailstone: Hailstone) -> bool:
-    """Check if rock will collide with a hailstone."""
-    # Solve for intersection time using any non-zero relative velocity component
-    if rock_vel.x != hailstone.velocity.x:
-        t = (hailstone.position.x - rock_pos.x) / (rock_vel.x - hailstone.velocity.x)
-    elif rock_vel.y != hailstone.velocity.y:
-        t = (hailstone.position.y - rock_pos.y) / (rock_vel.y - hailstone.velocity.y)
-    else:
-        t = (hailstone.position.z - rock_pos.z) / (rock_vel.z - hailstone.velocity.z)
-    
+    """Check exactly if rock will collide with a hailstone at some time t >= 0."""
+    offset = _difference(hailstone.position, rock_pos)
+    closing = _difference(rock_vel, hailstone.velocity)
+    if closing == Point3D(0, 0, 0):
+        return offset == Point3D(0, 0, 0)
+    axis = next(a for a in ('x', 'y', 'z') if getattr(closing, a))
+    t = Fraction(getattr(offset, axis), getattr(closing, axis))
     if t < 0:
         return False
-    
-    return True
+    return all(getattr(offset, a) == getattr(closing, a) * t for a in ('x', 'y', 'z'))
 
 def verify_solution(position: Point3D, velocity: Point3D, hailstones: List[Hailstone]) -> bool:
     """Verify if the rock's trajectory intersects all hailstones."""
@@ -119,4 +119,11 @@ def test_solve_part_two(capsys):
     input = puzzle.read_input()
     answer = puzzle.solve_part_two(input)
     print(f'Part Two : {answer}')
-    assert 765636044333842 == answer
\ No newline at end of file
+    assert 765636044333842 == answer
+
+def test_verify_solution_is_exact():
+    hailstones = puzzle.parse_hailstones("""19, 13, 30 @ -2,  1, -2
+18, 19, 22 @ -1, -1, -2
+20, 25, 34 @ -2, -2, -4""")
+    assert puzzle.verify_solution(puzzle.Point3D(24, 13, 10), puzzle.Point3D(-3, 1, 2), hailstones)
+    assert not puzzle.verify_solution(puzzle.Point3D(24, 13, 11), puzzle.Point3D(-3, 1, 2), hailstones)
@@ -19,6 +19,29 @@ class Edge:
     def __hash__(self):
         return hash((self.start, self.end))
 
+def parse_wiring(input_text: str) -> Tuple[List[Edge], Set[str]]:
+    """Parse input text into unique undirected edges and the set of vertices."""
+    edges = []
+    vertices = set()
+    edges_seen = set()  # To avoid duplicate edges
+    for line in input_text.strip().split('\n'):
+        source, targets = line.strip().split(': ')
+        source = source.strip()
+        
+        for target in targets.strip().split():
+            # Ensure consistent edge ordering
+            if source < target:
+                edge = Edge(source, target)
+            else:
+                edge = Edge(target, source)
+                
+            if edge not in edges_seen:
+                edges.append(edge)
+                edges_seen.add(edge)
+                vertices.add(source)
+                vertices.add(target)
+    return edges, vertices
+
 class OptimizedKarger:
     def __init__(self, input_text: str):
         """Initialize the graph from input text."""
@@ -32,23 +55,7 @@ class OptimizedKarger:
 
     def _parse_input(self, input_text: str) -> None:
         """Parse input text into edges and vertices."""
-        edges_seen = set()  # To avoid duplicate edges
-        for line in input_text.strip().split('\n'):
-            source, targets = line.strip().split(': ')
-            source = source.strip()
-            
-            for target in targets.strip().split():
-                # Ensure consistent edge ordering
-                if source < target:
-                    edge = Edge(source, target)
-                else:
-                    edge = Edge(target, source)
-                    
-                if edge not in edges_seen:
-                    self.edges.append(edge)
-                    edges_seen.add(edge)
-                    self.vertices.add(source)
-                    self.vertices.add(target)
+        self.edges, self.vertices = parse_wiring(input_text)
 
     def _union_find_find(self, v: str, subsets: Dict[str, Tuple[str, int]]) -> str:
         """Find with path compression."""
@@ -149,9 +156,72 @@ class OptimizedKarger:
         raise RuntimeError(f"No 3-cut found after {self.max_iterations} iterations")
 
 
+class FlowCut:
+    """
+    Deterministic minimum cut using unit-capacity max-flow (Edmonds-Karp).
+
+    Vertices are indexed 0..n-1. The source is fixed at vertex 0 and every
+    other vertex is tried as a sink. Each flow stops as soon as it exceeds
+    the expected cut size, so a sink on the source's side costs at most
+    cut_size + 1 BFS passes. The first sink whose max flow equals the cut
+    size lies on the other side, and the vertices still reachable from the
+    source in the residual graph form one component.
+    """
+
+    def __init__(self, input_text: str):
+        self.edges, vertices = parse_wiring(input_text)
+        self.names = sorted(vertices)
+        index = {name: i for i, name in enumerate(self.names)}
+        self.adjacency: List[List[int]] = [[] for _ in self.names]
+        for edge in self.edges:
+            u, v = index[edge.start], index[edge.end]
+            self.adjacency[u].append(v)
+            self.adjacency[v].append(u)
+
+    def _max_flow(self, source: int, sink: int, limit: int) -> Tuple[int, Set[int]]:
+        """
+        Push unit flows from source to sink until no path is left or the flow
+        exceeds limit. Returns the flow and the source side of the residual.
+        """
+        n = len(self.adjacency)
+        flow: Dict[int, int] = defaultdict(int)  # u * n + v -> flow on u -> v
+        total = 0
+        while True:
+            parent = {source: source}
+            queue = deque([source])
+            while queue and sink not in parent:
+                u = queue.popleft()
+                for v in self.adjacency[u]:
+                    if v not in parent and flow[u * n + v] < 1:
+                        parent[v] = u
+                        queue.append(v)
+            if sink not in parent:
+                return total, set(parent)
+            total += 1
+            if total > limit:
+                return total, set()
+            v = sink
+            while v != source:
+                u = parent[v]
+                flow[u * n + v] += 1
+                flow[v * n + u] -= 1
+                v = u
+
+    def find_min_cut(self, cut_size: int = 3) -> Tuple[List[Edge], int]:
+        """Find a cut of cut_size wires; returns the wires and the product of component sizes."""
+        source = 0
+        for sink in range(1, len(self.names)):
+            flow, side = self._max_flow(source, sink, cut_size)
+            if flow == cut_size:
+                names = {self.names[v] for v in side}
+                wires = [e for e in self.edges if (e.start in names) != (e.end in names)]
+                return wires, len(side) * (len(self.names) - len(side))
+        raise RuntimeError(f"No {cut_size}-cut found")
+
 
-def solve_part_one(input_text):
-    solver = OptimizedKarger(input_text)
+def solve_part_one(input_text, method="flow"):
+    """Product of the two group sizes; method is "flow" (deterministic) or "karger"."""
+    solver = FlowCut(input_text) if method == "flow" else OptimizedKarger(input_text)
     wires, product = solver.find_min_cut()
     return product
 
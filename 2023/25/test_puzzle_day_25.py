@@ -32,4 +32,24 @@ def test_solve_part_two(capsys):
     input = puzzle.read_input()
     answer = puzzle.solve_part_two(input)
     print(f'Part Two : {answer}')
-    # assert 0 == answer
\ No newline at end of file
+    # assert 0 == answer
+
+def test_flow_cut_example():
+    input_text = """jqt: rhn xhk nvd
+rsh: frs pzl lsr
+xhk: hfx
+cmg: qnr nvd lhk bvb
+rhn: xhk bvb hfx
+bvb: xhk hfx
+pzl: lsr hfx nvd
+qnr: nvd
+ntq: jqt hfx bvb xhk
+nvd: lhk
+lsr: lhk
+rzs: qnr cmg lsr rsh
+frs: qnr lhk lsr"""
+
+    solver = puzzle.FlowCut(input_text)
+    wires, product = solver.find_min_cut()
+    assert product == 54
+    assert sorted((w.start, w.end) for w in wires) == [("bvb", "cmg"), ("hfx", "pzl"), ("jqt", "nvd")]
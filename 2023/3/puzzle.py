@@ -1,7 +1,11 @@
-import re
-from functools import reduce
+import sys
+from pathlib import Path
+
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # repo root, for utils/
+from utils.helpers import Grid
+
 def readInput():
     with open((__file__.rstrip("puzzle.py")+"input.txt"), 'r') as input_file:
         return input_file.read()
@@ -13,112 +17,74 @@ def parse(lines):
     return data
 
 def get_schematic(data):
-    schematic = np.array(list(data), dtype=np.dtype(str))
-    schematic = np.pad(schematic, 1, mode='constant', constant_values=['.'])
-    return schematic
+    """The schematic as a uint8 array of character codes, padded with '.'."""
+    return Grid.from_rows(data, pad=1).array(padded=True)
+
+NEIGHBOURS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+def label_numbers(schematic):
+    """
+    Label every run of digits in one pass.
+
+    Returns an int32 grid holding, for each digit cell, the 1-based id of
+    the number it belongs to (0 elsewhere), and the value of each number
+    indexed by id (values[0] is unused). The schematic is padded with '.',
+    so runs never wrap from one row into the next in row-major order.
+    """
+    codes = np.asarray(schematic)
+    digits = (codes >= ord('0')) & (codes <= ord('9'))
+    flat = digits.ravel()
+    starts = flat & ~np.concatenate(([False], flat[:-1]))
+    ends = flat & ~np.concatenate((flat[1:], [False]))
+    labels = np.where(flat, np.cumsum(starts), 0).astype(np.int32)
+
+    positions = np.flatnonzero(flat)
+    ids = labels[positions]
+    end_positions = np.flatnonzero(ends)
+    powers = end_positions[ids - 1] - positions
+    values = np.zeros(len(end_positions) + 1, dtype=np.int64)
+    np.add.at(values, ids, (codes.ravel()[positions] - ord('0')).astype(np.int64) * 10 ** powers)
+    return labels.reshape(digits.shape), values
+
+def symbol_mask(schematic):
+    codes = np.asarray(schematic)
+    return ~((codes >= ord('0')) & (codes <= ord('9'))) & (codes != ord('.'))
+
+def dilate(mask):
+    """OR of the mask shifted in all 8 directions; the outer ring is padding."""
+    rows, cols = mask.shape
+    grown = mask.copy()
+    for dr, dc in NEIGHBOURS:
+        grown[1:-1, 1:-1] |= mask[1 + dr:rows - 1 + dr, 1 + dc:cols - 1 + dc]
+    return grown
 
 def get_number_positions(matrix):
-    arr = np.array(matrix)
-
-    def get_number_indices(segment):
-        indices = []
-        i = 0
-        while i < len(segment):
-            start = i
-            while i < len(segment) and segment[i].isdigit():
-                i += 1
-            if i > start:
-                indices.append((start, i - 1))
-            i += 1
-        return indices
-
-    number_positions = []
-
-    for row in range(arr.shape[0]):
-        segments = get_number_indices(arr[row])
-
-        for start, end in segments:
-            length = end - start + 1
-            number_positions.append([row, start, length])
-
-    return number_positions
-
-def has_adjacent_symbols(row, col, length, schematic):
-    section = schematic[row - 1: row + 2, col - 1: col + length + 1]
-
-    top = np.all(section[0, :] == '.')
-    bottom = np.all(section[2, :] == '.')
-    left = np.all(section[:, 0] == '.')
-    right = np.all(section[:, -1] == '.')
-
-    return not all([top, bottom, left, right])
-    
-
-def extract_numbers(matrix, adjacent_numbers):
-    numbers = []
-    for row, col, length in adjacent_numbers:
-        number_str = ''.join(matrix[row][col:col+length])
-        numbers.append(int(number_str))
-    return numbers
+    labels, values = label_numbers(matrix)
+    rows, cols = np.nonzero(labels)
+    first = np.flatnonzero(np.diff(labels[rows, cols], prepend=0))
+    lengths = np.diff(np.append(first, len(rows)))
+    return [[int(rows[i]), int(cols[i]), int(length)] for i, length in zip(first, lengths)]
 
 def solvePartOne(schematic):
-    total = 0
-    
-    number_positions =  get_number_positions(schematic)
-
-    adjacent_numbers = [
-            [row, col, length] for row, col, length in number_positions
-            if has_adjacent_symbols(row, col, length, schematic)
-        ]
-    result_numbers = extract_numbers(schematic, adjacent_numbers)
-    total = sum(result_numbers)
-    return total
+    labels, values = label_numbers(schematic)
+    part_numbers = np.unique(labels[dilate(symbol_mask(schematic)) & (labels > 0)])
+    return int(values[part_numbers].sum())
 
 def find_star_positions(matrix):
-    star_positions = []
-    rows = len(matrix)
-    cols = len(matrix[0])
-
-    for i in range(rows):
-        for j in range(cols):
-            if matrix[i][j] == '*':
-                star_positions.append((i, j))
-
-    return star_positions
-
-def find_numbers_adjacent_to_star(matrix):
-    adjacent_to_star = []
-    rows = len(matrix)
-    cols = len(matrix[0])
-
-    for i in range(rows):
-        for j in range(cols):
-            if matrix[i][j] == '*':
-                adjacent_cells = [
-                    (i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)
-                ]
-                for x, y in adjacent_cells:
-                    if 0 <= x < rows and 0 <= y < cols and matrix[x][y].isdigit():
-                        adjacent_to_star.append((x, y))
-
-    return adjacent_to_star
+    return [(int(row), int(col)) for row, col in np.argwhere(np.asarray(matrix) == ord('*'))]
 
 def solvePartTwo(schematic):
-    total = 0
-    number_positions = get_number_positions(schematic)
-    star_positions = find_star_positions(schematic)
-    
-    for star_row, star_col in star_positions:
-        neighbors = [
-            [row, col, length] for row, col, length in number_positions 
-            if row - 1 <= star_row <= row + 1 and col - 1 <= star_col <= col + length
-        ]
-        
-        if len(neighbors) == 2:
-            numbers = [
-                int(''.join(schematic[row][col:col + length])) 
-                for row, col, length in neighbors
-            ]
-            total += numbers[0] * numbers[1]
-
-    return total
\ No newline at end of file
+    """
+    Sum of gear ratios: gather the labels around every '*' at once and keep
+    the stars touching exactly two distinct numbers.
+    """
+    labels, values = label_numbers(schematic)
+    stars = np.argwhere(np.asarray(schematic) == ord('*'))
+    if not len(stars):
+        return 0
+    around = np.stack([labels[stars[:, 0] + dr, stars[:, 1] + dc] for dr, dc in NEIGHBOURS], axis=1)
+    around.sort(axis=1)
+    distinct = (around > 0) & (np.diff(around, axis=1, prepend=0) != 0)
+    gears = distinct.sum(axis=1) == 2
+    ratios = np.where(distinct, values[around], 1).prod(axis=1)
+    return int(ratios[gears].sum())
@@ -60,4 +60,11 @@ def test_pass_solveB(capsys):
     schematic = puzzle.get_schematic(data)
     answer = puzzle.solvePartTwo(schematic)
     print(f'Part Two : {answer}')
-    assert answer == 78272573
\ No newline at end of file
+    assert answer == 78272573
+
+def test_label_numbers():
+    schematic = puzzle.get_schematic(puzzle.parse("12.\n.*3"))
+    labels, values = puzzle.label_numbers(schematic)
+    assert labels[1:-1, 1:-1].tolist() == [[1, 1, 0], [0, 0, 2]]
+    assert values.tolist() == [0, 12, 3]
+    assert puzzle.solvePartTwo(schematic) == 36
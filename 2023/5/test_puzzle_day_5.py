@@ -44,6 +44,11 @@ def test_basic_seed_mappings():
     answer = puzzle.solvePartOne(TEST_INPUT)
     assert answer == 35
 
+def test_composed_map_matches_example_locations():
+    seeds, maps = puzzle.parse(TEST_INPUT)
+    almanac = puzzle.build_almanac_map(maps)
+    assert [almanac(seed) for seed in seeds] == [82, 43, 86, 35]
+
 def test_pass_solveOne(capsys):
     print('Solving Part One:')
     input = puzzle.readInput()
@@ -1,10 +1,8 @@
-import sys
 import re
-from functools import reduce
-import numpy as np
-import pandas as pd
 import math
 
+import numpy as np
+
 def readInput():
     with open((__file__.rstrip("puzzle.py")+"input.txt"), 'r') as input_file:
         return input_file.read()
@@ -40,67 +38,71 @@ def parse_with_kerning(input):
     return race
 
 
-def max_distance_ways(t, race_duration, race_distance, ways):
-    # Base case
-    if t == 0:
-        return 0, 0
-
-    # Hold the button for one more millisecond
-    max_distance_hold, ways_hold = max_distance_ways(t - 1, race_duration, race_distance, ways)
-    ways += ways_hold
-
-    # Let go of the button and start moving
-    max_distance_move = t * (race_duration - t)
-
-    # If the distance covered during acceleration plus constant speed exceeds the record distance, increment ways
-    if max_distance_move > race_distance:
-        ways += 1
-
-    return max(max_distance_hold, max_distance_move), ways
-
-
-def solvePartOne(input):    
-    result = 1
-
-    races = parse(input)
-
-    # Calculate the number of ways to beat the record distance for each race
-    for race in races:
-        race_duration = race['Time']
-        record_distance = race['Distance']
-        max_dist, ways = max_distance_ways(race_duration, race_duration, record_distance, 0)
-        result *= ways
-
-    return result
-
-
 def ways_to_beat_record(total_time, distance):
-    discriminant = total_time * total_time - (4 * distance)
-
-    if discriminant < 0:
+    """
+    Count the hold times h in [0, total_time] with h * (total_time - h) > distance.
+
+    Exact for any integer size: the winning holds lie strictly between the
+    roots (T -+ sqrt(T^2 - 4D)) / 2. With r = isqrt(T^2 - 4D) the lower root
+    lies in ((T - r - 1) / 2, (T - r) / 2], so one integer check settles the
+    first winning hold, and by symmetry the last one is T minus it.
+    """
+    discriminant = total_time * total_time - 4 * distance
+    if discriminant <= 0:
         return 0
-    
-    sqrt_discriminant = math.sqrt(discriminant)
-    max_value = (total_time + sqrt_discriminant) / 2
-    min_value = (total_time - sqrt_discriminant) / 2
+    root = math.isqrt(discriminant)
+    first = max((total_time - root - 1) // 2 + 1, 0)
+    if first * (total_time - first) <= distance:
+        first += 1
+    return max(total_time - 2 * first + 1, 0)
+
+
+def ways_to_beat_records(times, distances):
+    """
+    ways_to_beat_record for a whole table of races at once.
+
+    Races whose squared time fits in int64 are done with NumPy, using a
+    float square root corrected to the exact integer root. Anything larger
+    falls back to the scalar version.
+    """
+    times = np.asarray(times, dtype=object)
+    distances = np.asarray(distances, dtype=object)
+    if not times.size or max(times.max(), abs(distances).max()) >= 2 ** 30:
+        return np.array([ways_to_beat_record(t, d) for t, d in zip(times, distances)], dtype=object)
+
+    times = times.astype(np.int64)
+    distances = distances.astype(np.int64)
+    discriminant = times * times - 4 * distances
+    root = np.sqrt(np.maximum(discriminant, 0).astype(np.float64)).astype(np.int64)
+    root = np.where(root * root > discriminant, root - 1, root)
+    root = np.where((root + 1) * (root + 1) <= discriminant, root + 1, root)
+
+    first = np.maximum((times - root - 1) // 2 + 1, 0)
+    first = np.where(first * (times - first) <= distances, first + 1, first)
+    return np.where(discriminant > 0, np.maximum(times - 2 * first + 1, 0), 0)
 
-    if min_value.is_integer():
-        min_value += 1
-    else:
-        min_value = math.ceil(min_value)
 
-    if max_value.is_integer():
-        max_value -= 1
-    else:
-        max_value = math.floor(max_value)
+def max_distance_ways(t, race_duration, race_distance, ways):
+    """
+    Best distance and number of winning holds among hold times 1..t, added to ways.
+    """
+    best_hold = min(max(race_duration // 2, 1), t)
+    max_distance = best_hold * (race_duration - best_hold) if t else 0
+    winning = ways_to_beat_record(race_duration, race_distance)
+    if winning:
+        # Winning holds form the range [first, race_duration - first]; clip to 1..t
+        first = (race_duration - winning + 1) // 2
+        winning = max(min(race_duration - first, t) - max(first, 1) + 1, 0)
+    return max_distance, ways + winning
+
+
+def solvePartOne(input):
+    races = parse(input)
+    times = [race['Time'] for race in races]
+    distances = [race['Distance'] for race in races]
+    return int(np.prod(ways_to_beat_records(times, distances), dtype=object))
 
-    return int(max_value - min_value) + 1
 
 def solvePartTwo(input):
     race = parse_with_kerning(input)
-    print(f'race: {race}')
-    race_duration = race['Time']
-    record_distance = race['Distance']
-
-    ways = ways_to_beat_record(race_duration, record_distance)
-    return ways
\ No newline at end of file
+    return ways_to_beat_record(race['Time'], race['Distance'])
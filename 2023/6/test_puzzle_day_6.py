@@ -38,4 +38,17 @@ def test_pass_solveTwo(capsys):
     input = puzzle.readInput()
     answer = puzzle.solvePartTwo(input)
     print(f'Part Two : {answer}')
-    # assert answer == 0  # Commented out as in original
\ No newline at end of file
+    # assert answer == 0  # Commented out as in original
+
+@pytest.mark.parametrize("time, distance, expected", [
+    (30, 200, 9),      # roots 10 and 20 are exact ties and do not count
+    (30, 224, 1),      # only h = 15 wins
+    (30, 225, 0),      # h = 15 only ties
+    (10**30, 10**28 * (10**30 - 10**28), 10**30 - 2 * 10**28 - 1),
+])
+def test_ways_to_beat_record_boundaries(time, distance, expected):
+    assert puzzle.ways_to_beat_record(time, distance) == expected
+
+def test_ways_to_beat_records_batch():
+    answer = puzzle.ways_to_beat_records([7, 15, 30], [9, 40, 200])
+    assert list(answer) == [4, 8, 9]
@@ -1,7 +1,8 @@
 import re
 from enum import Enum
 from collections import Counter
-from functools import cmp_to_key
+
+import numpy as np
 
 class HandType(Enum):
   FIVE_OF_A_KIND = 7
@@ -90,51 +91,30 @@ def identify_hand_type_with_joker(hand):
     return HandType.HIGH_CARD
 
 
+def hand_key(hand):
+    """Hand type in the high nibble, then the five card ranks, 4 bits each."""
+    key = identify_hand_type(hand).value
+    for card in hand:
+        key = key << 4 | CARD_ORDER.index(card)
+    return key
+
+def hand_key_with_joker(hand):
+    key = identify_hand_type_with_joker(hand).value
+    for card in hand:
+        key = key << 4 | CARD_ORDER_WITH_JOKER.index(card)
+    return key
+
 def compare(hand_A, hand_B):
-    hand1_type = identify_hand_type(hand_A['hand'])
-    hand2_type = identify_hand_type(hand_B['hand'])
-    
-    if hand1_type.value > hand2_type.value:
-        return 1
-    elif hand1_type.value < hand2_type.value:
-        return -1
-    
-    # If hand types are the same, compare individual cards
-    for card_A, card_B in zip(hand_A['hand'], hand_B['hand']):
-        if card_A == card_B:
-            continue
-        if CARD_ORDER.index(card_A) > CARD_ORDER.index(card_B):
-            return 1
-        else:
-            return -1
-    
-    # If all cards are identical, it's a tie
-    return 0
+    key_A, key_B = hand_key(hand_A['hand']), hand_key(hand_B['hand'])
+    return (key_A > key_B) - (key_A < key_B)
 
 def compare_with_joker(hand_A, hand_B):
-    hand1_type = identify_hand_type_with_joker(hand_A['hand'])
-    hand2_type = identify_hand_type_with_joker(hand_B['hand'])
-    
-    if hand1_type.value > hand2_type.value:
-        return 1
-    elif hand1_type.value < hand2_type.value:
-        return -1
-    
-    # If hand types are the same, compare individual cards
-    for card_A, card_B in zip(hand_A['hand'], hand_B['hand']):
-        if card_A == card_B:
-            continue
-        if CARD_ORDER_WITH_JOKER.index(card_A) > CARD_ORDER_WITH_JOKER.index(card_B):
-            return 1
-        else:
-            return -1
-    
-    # If all cards are identical, it's a tie
-    return 0
+    key_A, key_B = hand_key_with_joker(hand_A['hand']), hand_key_with_joker(hand_B['hand'])
+    return (key_A > key_B) - (key_A < key_B)
 
 
 def rank_hands(hands):
-    hands.sort(key=cmp_to_key(compare))
+    hands.sort(key=lambda item: hand_key(item['hand']))
     
     for i, hand in enumerate(hands):
         hand["rank"] = i + 1
@@ -142,13 +122,55 @@ def rank_hands(hands):
     return hands
 
 def rank_hands_with_joker(hands):
-    hands.sort(key=cmp_to_key(compare_with_joker))
+    hands.sort(key=lambda item: hand_key_with_joker(item['hand']))
     
     for i, hand in enumerate(hands):
         hand["rank"] = i + 1
 
     return hands
 
+# Sum over the five cards of how often each one occurs, i.e. the sum of
+# squared group sizes, identifies the hand type
+TYPE_BY_SQUARES = np.zeros(26, dtype=np.int64)
+for squares, hand_type in ((25, HandType.FIVE_OF_A_KIND), (17, HandType.FOUR_OF_A_KIND),
+                           (13, HandType.FULL_HOUSE), (11, HandType.THREE_OF_A_KIND),
+                           (9, HandType.TWO_PAIR), (7, HandType.ONE_PAIR), (5, HandType.HIGH_CARD)):
+    TYPE_BY_SQUARES[squares] = hand_type.value
+
+def hand_keys(hands, joker=False):
+    """
+    Integer keys of many hands at once, matching hand_key / hand_key_with_joker.
+
+    Jokers join the largest group of other cards, which raises the sum of
+    squared group sizes from m^2 to (m + jokers)^2 for that group.
+    """
+    order = CARD_ORDER_WITH_JOKER if joker else CARD_ORDER
+    ranks = np.zeros(256, dtype=np.int64)
+    ranks[np.frombuffer(order.encode(), dtype=np.uint8)] = np.arange(len(order))
+    cards = np.frombuffer("".join(hands).encode(), dtype=np.uint8).reshape(-1, 5)
+
+    same = cards[:, :, None] == cards[:, None, :]
+    if joker:
+        wild = cards == ord("J")
+        same &= ~wild[:, :, None] & ~wild[:, None, :]
+        group = same.sum(axis=2)
+        largest = group.max(axis=1)
+        jokers = wild.sum(axis=1)
+        squares = group.sum(axis=1) - largest ** 2 + (largest + jokers) ** 2
+    else:
+        squares = same.sum(axis=(1, 2))
+
+    keys = TYPE_BY_SQUARES[squares]
+    for column in range(5):
+        keys = keys << 4 | ranks[cards[:, column]]
+    return keys
+
+def total_winnings(hands, bids, joker=False):
+    """Sum of bid times rank, ranking every hand with one argsort over hand_keys."""
+    order = np.argsort(hand_keys(hands, joker), kind="stable")
+    ranks = np.arange(1, len(order) + 1, dtype=np.int64)
+    return int((np.asarray(bids, dtype=np.int64)[order] * ranks).sum())
+
 def solvePartOne(hands):
     ranked_hands =  rank_hands(hands)
     result = sum(item['rank'] * item['bid'] for item in ranked_hands)
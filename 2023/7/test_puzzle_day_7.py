@@ -97,4 +97,21 @@ def test_pass_solveTwo(capsys):
     hands = puzzle.parse(input)
     answer = puzzle.solvePartTwo(hands)
     print(f'Part Two : {answer}')
-    assert 248256639 == answer
\ No newline at end of file
+    assert 248256639 == answer
+
+def test_hand_key_orders_type_then_cards():
+    assert puzzle.hand_key('33332') > puzzle.hand_key('2AAAA')
+    assert puzzle.hand_key('KK677') > puzzle.hand_key('KTJJT')
+    assert puzzle.hand_key_with_joker('KTJJT') > puzzle.hand_key_with_joker('QQQJA')
+
+@pytest.mark.parametrize("joker", [False, True])
+def test_numpy_keys_match_scalar_keys(joker):
+    hands = [item['hand'] for item in puzzle.parse(puzzle.readInput())]
+    scalar = puzzle.hand_key_with_joker if joker else puzzle.hand_key
+    assert list(puzzle.hand_keys(hands, joker)) == [scalar(hand) for hand in hands]
+
+def test_total_winnings():
+    hands = puzzle.parse(TEST_INPUT)
+    cards, bids = [h['hand'] for h in hands], [h['bid'] for h in hands]
+    assert puzzle.total_winnings(cards, bids) == 6440
+    assert puzzle.total_winnings(cards, bids, joker=True) == 5905
@@ -1,8 +1,4 @@
-import sys
 import re
-from functools import reduce
-import numpy as np
-import pandas as pd
 from math import gcd
 
 class Node:
@@ -28,58 +24,133 @@ def parse(input):
 
     return instructions, nodes
 
+class Navigator:
+    """
+    The network with node names interned to integer ids.
+
+    jump[node] is where one full pass over the instructions leads and
+    hits[node] lists the offsets within that pass at which a target node is
+    stood on. Block starts always sit at instruction 0, so a walk is just a
+    sequence of block-start nodes, which makes cycles easy to spot. Larger
+    jumps use binary lifting over the block table.
+    """
+
+    def __init__(self, instructions, connections, is_target):
+        self.names = list(connections)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.length = len(instructions)
+        moves = (
+            [self.ids[left] for left, _ in connections.values()],
+            [self.ids[right] for _, right in connections.values()],
+        )
+        self.turns = turns = [moves[instruction == 'R'] for instruction in instructions]
+        target = [is_target(name) for name in self.names]
+
+        self.jump, self.hits = [], []
+        for node in range(len(self.names)):
+            hits = []
+            for offset, turn in enumerate(turns):
+                if target[node]:
+                    hits.append(offset)
+                node = turn[node]
+            self.jump.append(node)
+            self.hits.append(hits)
+        self.lifting = [self.jump]
+
+    def advance(self, name, steps):
+        """The node reached after a number of steps."""
+        blocks, rest = divmod(steps, self.length)
+        node = self.ids[name]
+        level = 0
+        while blocks:
+            if level == len(self.lifting):
+                previous = self.lifting[-1]
+                self.lifting.append([previous[n] for n in previous])
+            if blocks & 1:
+                node = self.lifting[level][node]
+            blocks >>= 1
+            level += 1
+        for turn in self.turns[:rest]:
+            node = turn[node]
+        return self.names[node]
+
+    def cycle(self, name):
+        """
+        Follow one walker until its block-start node repeats.
+
+        Returns (offset, period, hits): the walk is periodic with the given
+        period from step offset on, and hits lists every step before
+        offset + period at which a target node is stood on.
+        """
+        node, seen, hits, steps = self.ids[name], {}, [], 0
+        while node not in seen:
+            seen[node] = steps
+            hits.extend(steps + offset for offset in self.hits[node])
+            node = self.jump[node]
+            steps += self.length
+        offset = seen[node]
+        return offset, steps - offset, hits
+
+    def steps_to_target(self, name):
+        """Steps until a target node is first stood on, or None if never."""
+        _, _, hits = self.cycle(name)
+        return hits[0] if hits else None
+
+
+def combine_congruences(first, second):
+    """Generalised CRT: merge t = r1 (mod m1) and t = r2 (mod m2), or None."""
+    r1, m1 = first
+    r2, m2 = second
+    g = gcd(m1, m2)
+    if (r2 - r1) % g:
+        return None
+    step = m2 // g
+    k = (r2 - r1) // g * pow(m1 // g, -1, step) % step if step > 1 else 0
+    modulus = m1 // g * m2
+    return (r1 + m1 * k) % modulus, modulus
+
+
+def first_common_hit(cycles):
+    """
+    Earliest step at which every walker stands on a target at once.
+
+    Each cycle is (offset, period, hits) as returned by Navigator.cycle.
+    Steps before every walker is in its loop can only be one of the listed
+    pre-loop hits, so those are checked directly. Later steps must satisfy
+    one residue per walker, which are merged with the generalised CRT.
+    """
+    def hit_at(offset, period, hits, step):
+        if step >= offset:
+            step = offset + (step - offset) % period
+        return step in hits
+
+    lookups = [(offset, period, set(hits)) for offset, period, hits in cycles]
+    start = max(offset for offset, _, _ in cycles)
+    best = None
+    for _, _, hits in cycles:
+        for step in hits:
+            if step < start and all(hit_at(*lookup, step) for lookup in lookups):
+                best = step if best is None else min(best, step)
+
+    combined = [(0, 1)]
+    for offset, period, hits in cycles:
+        residues = [(hit % period, period) for hit in hits if hit >= offset]
+        combined = [merged for known in combined for residue in residues
+                    if (merged := combine_congruences(known, residue)) is not None]
+    for residue, modulus in combined:
+        step = start + (residue - start) % modulus
+        best = step if best is None else min(best, step)
+    return best
+
+
 def follow_instructions(start_node, instructions, connections):
-    current_node = start_node
-    steps = 0
-
-    while current_node != 'ZZZ':        
-        if instructions[steps % len(instructions)] == 'L':
-            current_node = connections[current_node][0]
-        elif instructions[steps % len(instructions)] == 'R':
-            current_node = connections[current_node][1]
-        steps += 1
-    return steps
-
-def follow_instruction(instructions, connections, current_node):
-    idx = 0
-    while idx < len(instructions):
-        if instructions[idx] == 'L':
-            current_node = connections[current_node][0]  # Move to the left node
-        elif instructions[idx] == 'R':
-            current_node = connections[current_node][1]  # Move to the right node
-        idx += 1
-    return current_node
-
-def lcm(a, b):
-    return a * b // gcd(a, b)
+    navigator = Navigator(instructions, connections, lambda name: name == 'ZZZ')
+    return navigator.steps_to_target(start_node)
 
 def follow_instructions_all(start_nodes, instructions, connections):
-    current_nodes = [node for node in start_nodes if node.endswith('A')]
-    steps_needed = []  # List to store the steps needed for each node to reach 'Z'
-    steps = 0  # Total steps taken
-
-    while len(current_nodes) > 0:
-        new_current_nodes = []  # List to store nodes that haven't reached 'Z'
-        steps += len(instructions) 
-
-        # Loop through each current node
-        for current_node in current_nodes:
-            for instruction in instructions:
-                if instruction == 'L':
-                    current_node = connections[current_node][0]  # Move to the left node
-                elif instruction == 'R':
-                    current_node = connections[current_node][1]  # Move to the right node
-            
-            if current_node.endswith('Z'):
-                steps_needed.append(steps)  # Add steps needed to reach 'Z' for this node
-            else:
-                new_current_nodes.append(current_node)  # Node hasn't reached 'Z', continue processing
-
-        current_nodes = new_current_nodes  # Update current nodes to those not yet reaching 'Z'
-
-    # Calculate LCM of all step counts to find the minimum steps for all 'A'-ending nodes to reach 'Z'
-    result = reduce(lcm, steps_needed)
-    return result
+    navigator = Navigator(instructions, connections, lambda name: name.endswith('Z'))
+    cycles = [navigator.cycle(node) for node in start_nodes if node.endswith('A')]
+    return first_common_hit(cycles)
 
 
 def solvePartOne(input):
@@ -91,4 +162,4 @@ def solvePartOne(input):
 def solvePartTwo(input):
     instructions, nodes = parse(input)
     steps_taken = follow_instructions_all(nodes.keys(),instructions, nodes)
-    return steps_taken
\ No newline at end of file
+    return steps_taken
@@ -65,4 +65,19 @@ def test_solveTwo(capsys):
     input = puzzle.readInput()
     answer = puzzle.solvePartTwo(input)
     print(f'Part Two : {answer}')
-    assert answer == 20685524831999
\ No newline at end of file
+    assert answer == 20685524831999
+
+def test_first_common_hit_with_offset_residues():
+    # t = 1 (mod 4) and t = 3 (mod 6): a plain LCM of the first hits gives 3, not 9
+    assert puzzle.first_common_hit([(0, 4, [1]), (0, 6, [3])]) == 9
+    assert puzzle.first_common_hit([(0, 4, [1]), (0, 6, [2])]) is None
+
+def test_first_common_hit_before_loops():
+    # Both stand on a target at step 2, before the second walker loops
+    assert puzzle.first_common_hit([(0, 2, [0]), (5, 4, [2, 6])]) == 2
+
+def test_navigator_cycle_and_advance():
+    instructions, nodes = puzzle.parse(TEST_INPUT3)
+    navigator = puzzle.Navigator(instructions, nodes, lambda name: name.endswith('Z'))
+    assert navigator.cycle('22A') == (2, 6, [3, 6])
+    assert navigator.advance('22A', 1_000_001) == '22C'
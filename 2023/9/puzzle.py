@@ -1,8 +1,6 @@
-import sys
-import re
-from functools import reduce
+from math import comb
+
 import numpy as np
-import pandas as pd
 
 
 def readInput():
@@ -20,41 +18,62 @@ def parse(input):
     return list_of_sets
 
 
-def calculate_differences(nums):
-    differences = []
-    for i in range(len(nums) - 1):
-        differences.append(nums[i + 1] - nums[i])
-    return differences
+def binomial_weights(length):
+    """
+    Weights w with w @ sequence == the next value of a sequence of that length.
 
+    Repeated differencing until the row is constant is the same as fitting a
+    polynomial of degree < length, whose next value is
+    sum((-1) ** (length - 1 - i) * C(length, i) * x[i]). The previous value
+    uses the same weights reversed.
+    """
+    return [(-1) ** (length - 1 - i) * comb(length, i) for i in range(length)]
 
-def predict_next_number(sequence):
-    result = sequence[-1]
-    while len(set(sequence)) > 1:
-        sequence = calculate_differences(sequence)
 
-        result += sequence[-1]
-    return result
+def predict_next_number(sequence):
+    return sum(w * x for w, x in zip(binomial_weights(len(sequence)), sequence))
 
 
-def solvePartOne(input):
-    result = 0
-    history = parse(input)
-    for sequence in history:
-        next_number = predict_next_number(sequence)
-        result += next_number
-    return result
+def predict_previous_number(sequence):
+    return predict_next_number(sequence[::-1])
+
+
+def parse_array(input):
+    """
+    Histories as 2D int64 arrays, one per distinct sequence length.
+
+    Inputs where every history has the same length (the usual case) are
+    read with a single NumPy call into one array.
+    """
+    text = input.strip()
+    if not text:
+        return []
+    lines = text.splitlines()
+    width = len(lines[0].split())
+    if all(len(line.split()) == width for line in lines):
+        values = np.fromstring(text, dtype=np.int64, sep=" ")
+        return [values.reshape(len(lines), width)]
+    by_length = {}
+    for line in filter(str.strip, lines):
+        sequence = parse_sequence(line)
+        by_length.setdefault(len(sequence), []).append(sequence)
+    return [np.array(rows, dtype=np.int64) for rows in by_length.values()]
+
+
+def extrapolate(histories):
+    """Next and previous values of every row, as one matrix-vector product each."""
+    weights = binomial_weights(histories.shape[1])
+    largest = int(np.abs(histories).max()) if histories.size else 0
+    if largest * sum(map(abs, weights)) >= 2 ** 63:
+        # Could overflow int64, fall back to Python ints
+        histories = histories.astype(object)
+    weights = np.array(weights, dtype=histories.dtype)
+    return histories @ weights, histories @ weights[::-1]
 
 
-def predict_previous_number(sequence):
-    sequence = sequence[::-1]  # Reverse the sequence
-    result = predict_next_number(sequence)
-    return result
+def solvePartOne(input):
+    return int(sum(extrapolate(histories)[0].sum() for histories in parse_array(input)))
 
 
 def solvePartTwo(input):
-    result = 0
-    history = parse(input)
-    for sequence in history:
-        next_number = predict_previous_number(sequence)
-        result += next_number
-    return result
+    return int(sum(extrapolate(histories)[1].sum() for histories in parse_array(input)))
@@ -48,3 +48,23 @@ def test_solveTwo(capsys):
     answer = puzzle.solvePartTwo(input)
     print(f"Part Two : {answer}")
     assert 1152 == answer
+
+def test_extrapolate_rows_at_once():
+    (histories,) = puzzle.parse_array(TEST_INPUT)
+    next_values, previous_values = puzzle.extrapolate(histories)
+    assert list(next_values) == [18, 28, 68]
+    assert list(previous_values) == [-3, 0, 5]
+
+def test_parse_array_groups_ragged_input():
+    blocks = puzzle.parse_array("1 2 3\n4 5 6 7\n7 8 9")
+    assert sorted(block.shape for block in blocks) == [(1, 4), (2, 3)]
+    assert puzzle.solvePartOne("1 2 3\n4 5 6 7\n7 8 9") == 4 + 8 + 10
+
+def test_extrapolate_falls_back_to_python_ints():
+    histories = puzzle.np.array([[10**17 * i for i in range(21)]])
+    next_values, previous_values = puzzle.extrapolate(histories)
+    assert next_values[0] == 21 * 10**17 and previous_values[0] == -(10**17)
+
+def test_parse_array_checks_every_line_length():
+    # Six values over three lines, but the lines aren't all two long
+    assert puzzle.solvePartOne("1 5\n3 9 4\n6") == 9 - 12 + 6
@@ -3,11 +3,18 @@ Advent of Code 2025 - Day 4
 Author: Rajesh M R
 """
 
+import sys
 from pathlib import Path
 from typing import List, Tuple
 
 import numpy as np
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))  # repo root, for utils/
+from utils.helpers import Grid
+
+ROLL = ord("@")
+EMPTY = ord(".")
+
 
 def read_input(filename="input.txt"):
     """Read and return the input file contents."""
@@ -39,29 +46,24 @@ def solve_part_one(grid):
     Returns:
         The answer to part one
     """
-    rows, cols = grid.shape
-    # All 8 directions (including diagonals)
-    directions = [
-        (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
-    ]
+    grid = Grid.from_rows(grid, pad=1)
+    cells = grid.data
 
     return sum(
-        grid[r, c] == "@"
-        and sum(
-            0 <= r + dr < grid.shape[0]
-            and 0 <= c + dc < grid.shape[1]
-            and grid[r + dr, c + dc] == "@"
-            for dr, dc in directions
-        )
-        < 4
-        for r in range(grid.shape[0])
-        for c in range(grid.shape[1])
+        1
+        for i in grid.cells()
+        if cells[i] == ROLL
+        and sum(cells[i + offset] == ROLL for offset in grid.neighbours8) < 4
     )
 
 
 def solve_part_two(data):
     """
-    Solve part two of the puzzle.
+    Count rolls removed by repeatedly taking every accessible roll.
+
+    Removing a roll only ever lowers its neighbours' counts, so instead of
+    rescanning the grid each round we keep a neighbour count per cell and
+    queue a roll the moment its count drops below 4.
 
     Args:
         data: Parsed input data
@@ -69,53 +71,30 @@ def solve_part_two(data):
     Returns:
         The answer to part two
     """
-    grid = data.copy()
-    rows, cols = grid.shape
-
-    directions = [
-        (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
-    ]
-
-    to_check = {tuple(pos) for pos in np.argwhere(grid == "@")}
-
-    def neighbors(r, c):
-        return sum(
-            0 <= r + dr < grid.shape[0]
-            and 0 <= c + dc < grid.shape[1]
-            and grid[r + dr, c + dc] == "@"
-            for dr, dc in directions
-        )
+    grid = Grid.from_rows(data, pad=1)
+    cells = grid.data
+    offsets = grid.neighbours8
+
+    counts = {
+        i: sum(cells[i + offset] == ROLL for offset in offsets)
+        for i in grid.cells()
+        if cells[i] == ROLL
+    }
+    accessible = [i for i, count in counts.items() if count < 4]
+    for i in accessible:
+        cells[i] = EMPTY
 
     total_removed = 0
-
-    def get_affected_neighbours(r, c):
-        affected = set()
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] == "@":
-                affected.add((nr, nc))
-
-        return affected
-
-    while to_check and (
-        accessible := [
-            pos for pos in to_check if grid[tuple(pos)] == "@" and neighbors(*pos) < 4
-        ]
-    ):
-        to_check = {
-            (r + dr, c + dc)
-            for r, c in accessible
-            for dr, dc in directions
-            if 0 <= r + dr < grid.shape[0]
-            and 0 <= c + dc < grid.shape[1]
-            and grid[r + dr, c + dc] == "@"
-        }
-
-        for pos in accessible:
-            grid[tuple(pos)] = "."
-        total_removed += len(accessible)
-
-        print(f"Removed {len(accessible)} rolls (total: {total_removed})")
+    while accessible:
+        i = accessible.pop()
+        total_removed += 1
+        for offset in offsets:
+            neighbour = i + offset
+            if cells[neighbour] == ROLL:
+                counts[neighbour] -= 1
+                if counts[neighbour] < 4:
+                    cells[neighbour] = EMPTY
+                    accessible.append(neighbour)
 
     return total_removed
 
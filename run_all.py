@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Run every Advent of Code puzzle in the repository and benchmark it.
+Usage: python run_all.py [year] [day] [--parallel] [--baseline FILE] [--compare FILE]
+
+Each day runs in a fresh interpreter so its peak RSS is measured in isolation
+and a slow or crashing day cannot take the rest of the run down with it.
+With --parallel every (year, day, part) job runs in its own process, several
+at a time, longest expected job first, using the timings recorded by previous
+runs.
+"""
+import argparse
+import contextlib
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module
+    resource = None
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+ROOT = Path(__file__).resolve().parent
+YEARS = ("2023", "2024", "2025")
+DEFAULT_TIMEOUT = 300        # Seconds before a day is killed
+KILL_GRACE = 5               # Seconds between SIGTERM and SIGKILL for a timed-out day
+REGRESSION_FACTOR = 1.25     # Slower than baseline by this factor is a regression
+REGRESSION_FLOOR = 0.01      # Ignore regressions on phases faster than this (seconds)
+TIMINGS_FILE = ROOT / ".run_all_timings.json"  # Last known timings, used for scheduling
+# ============================================================================
+
+READ_NAMES = ("read_input", "readInput")
+PART_NAMES = {
+    1: ("solve_part_one", "solvePartOne", "solvePartA"),
+    2: ("solve_part_two", "solvePartTwo", "solvePartB"),
+}
+PHASES = ("parse", "part1", "part2")
+
+# Older days whose solvers expect parsed data instead of the raw input text.
+# Days generated from template/ are detected from their read_input signature.
+PREPARE_OVERRIDES = {
+    ("2023", 2): lambda module, raw: module.parse(raw),
+    ("2023", 3): lambda module, raw: module.get_schematic(module.parse(raw)),
+    ("2023", 4): lambda module, raw: module.parse(raw),
+    ("2023", 7): lambda module, raw: module.parse(raw),
+}
+
+
+@dataclass(frozen=True)
+class Day:
+    year: str
+    day: int
+    path: Path
+
+    @property
+    def key(self):
+        return f"{self.year}/{self.day:02d}"
+
+
+def discover_days(years=YEARS, day=None):
+    """Find every puzzle.py under the year folders, skipping templates."""
+    days = []
+    for year in years:
+        for puzzle in (ROOT / year).glob("*/puzzle.py"):
+            number = puzzle.parent.name.removeprefix("day_")
+            if number.isdigit() and (day is None or int(number) == day):
+                days.append(Day(year, int(number), puzzle.parent))
+    return sorted(days, key=lambda d: (d.year, d.day))
+
+
+def find_function(module, names):
+    """Return the first function of the module matching one of the names."""
+    for name in names:
+        function = getattr(module, name, None)
+        if callable(function):
+            return function
+    return None
+
+
+def load_puzzle(directory):
+    """Import a day's puzzle.py with its folder and the repo root on the path."""
+    sys.path[:0] = [str(directory), str(ROOT)]
+    spec = importlib.util.spec_from_file_location("puzzle", directory / "puzzle.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["puzzle"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def prepare_input(module, year, day):
+    """Read the input and shape it the way the day's solvers expect."""
+    read = find_function(module, READ_NAMES)
+    raw = read()
+    if (year, day) in PREPARE_OVERRIDES:
+        return PREPARE_OVERRIDES[(year, day)](module, raw)
+    if "filename" in inspect.signature(read).parameters and hasattr(module, "parse"):
+        return module.parse(raw)
+    return raw
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in megabytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(year, day, directory, parts):
+    """Time parse and each requested part of one day in the current process."""
+    result = {"status": "ok"}
+    try:
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            module = load_puzzle(Path(directory))
+            for part in parts:
+                solve = find_function(module, PART_NAMES[part])
+                if solve is None:
+                    continue
+                start = time.perf_counter()
+                data = prepare_input(module, year, day)
+                result.setdefault("parse", time.perf_counter() - start)
+
+                start = time.perf_counter()
+                answer = solve(data)
+                result[f"part{part}"] = time.perf_counter() - start
+                result[f"answer{part}"] = None if answer is None else str(answer)
+    except TimeoutError:
+        raise
+    except Exception as e:
+        result["status"] = f"error: {type(e).__name__}: {e}"
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def measure_day(year, day, directory, parts, connection):
+    """Child process entry point for sequential runs: measure and report back."""
+    connection.send(measure(year, day, directory, parts))
+    connection.close()
+
+
+def start_job(context, day, parts):
+    """Start measuring one day in a fresh interpreter; returns (process, receiver)."""
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=measure_day,
+        args=(day.year, day.day, str(day.path), tuple(parts), sender),
+    )
+    process.start()
+    sender.close()
+    return process, receiver
+
+
+def stop_process(process):
+    """Reap a child, killing it if it is still running (even if stuck in C code)."""
+    if process.is_alive():
+        process.terminate()
+        process.join(KILL_GRACE)
+    if process.is_alive():
+        process.kill()
+    process.join()
+
+
+def receive_result(receiver):
+    try:
+        return receiver.recv()
+    except EOFError:
+        return {"status": "crashed"}
+
+
+def run_day(day, parts=(1, 2), timeout=DEFAULT_TIMEOUT):
+    """Run one day in a fresh interpreter and return its measurements."""
+    process, receiver = start_job(multiprocessing.get_context("spawn"), day, parts)
+    if receiver.poll(timeout):
+        result = receive_result(receiver)
+    else:
+        result = {"status": f"timeout after {timeout}s"}
+    stop_process(process)
+    return result
+
+
+def expected_seconds(key, part, timings):
+    """Expected run time of one job from previous runs; unknown jobs sort first."""
+    previous = timings.get(key, {})
+    if f"part{part}" not in previous:
+        return float("inf")
+    return previous.get("parse", 0) + previous[f"part{part}"]
+
+
+def merge_results(parts):
+    """Combine the per-part results of one day into a single day result."""
+    merged = {"status": "ok"}
+    for part in sorted(parts):
+        result = parts[part]
+        for name, value in result.items():
+            if name == "status":
+                if merged["status"] == "ok":
+                    merged["status"] = value
+            elif name == "peak_rss_mb":
+                merged[name] = max(merged.get(name) or 0, value or 0)
+            else:
+                merged.setdefault(name, value)
+    return merged
+
+
+def run_parallel(days, parts=(1, 2), timeout=DEFAULT_TIMEOUT, workers=None, timings=None):
+    """
+    Run every (day, part) job in its own process, longest expected job first.
+
+    At most workers jobs run at once. A job still running after the timeout
+    is killed, so a part stuck in native code cannot hold up the run.
+    """
+    timings = timings or {}
+    jobs = [(day, part) for day in days for part in parts]
+    jobs.sort(key=lambda job: expected_seconds(job[0].key, job[1], timings), reverse=True)
+    pending = iter(jobs)
+    workers = workers or os.cpu_count()
+
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    running = {}  # receiver -> (day, part, process, deadline)
+    while True:
+        while len(running) < workers:
+            job = next(pending, None)
+            if job is None:
+                break
+            day, part = job
+            process, receiver = start_job(context, day, (part,))
+            running[receiver] = (day, part, process, time.monotonic() + timeout)
+        if not running:
+            break
+
+        next_deadline = min(deadline for *_, deadline in running.values())
+        ready = wait(list(running), max(0, next_deadline - time.monotonic()))
+        now = time.monotonic()
+        for receiver in list(running):
+            day, part, process, deadline = running[receiver]
+            if receiver in ready:
+                result = receive_result(receiver)
+            elif deadline <= now:
+                result = {"status": f"timeout after {timeout}s"}
+            else:
+                continue
+            del running[receiver]
+            stop_process(process)
+            receiver.close()
+            results.setdefault(day.key, {})[part] = result
+    return {day.key: merge_results(results[day.key]) for day in days}
+
+
+def load_timings():
+    if TIMINGS_FILE.exists():
+        return json.loads(TIMINGS_FILE.read_text())
+    return {}
+
+
+def save_timings(results):
+    """Remember the latest successful timings so future runs can schedule by them."""
+    timings = load_timings()
+    for key, result in results.items():
+        entry = timings.setdefault(key, {})
+        for phase in PHASES:
+            if result.get(phase) is not None:
+                entry[phase] = result[phase]
+    TIMINGS_FILE.write_text(json.dumps(timings, indent=2, sort_keys=True))
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def print_report(results):
+    """Print a table of timings and peak memory per day."""
+    print(f"{'day':<9}{'parse':>10}{'part1':>11}{'part2':>11}{'peak MB':>10}  status")
+    print("-" * 60)
+    for key, result in results.items():
+        peak = result.get("peak_rss_mb")
+        print(
+            f"{key:<9}"
+            f"{format_seconds(result.get('parse')):>10}"
+            f"{format_seconds(result.get('part1')):>11}"
+            f"{format_seconds(result.get('part2')):>11}"
+            f"{'-' if peak is None else f'{peak:.1f}':>10}"
+            f"  {result['status']}"
+        )
+
+
+def find_regressions(results, baseline):
+    """Compare results against a saved baseline and describe what got worse."""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for phase in PHASES:
+            now, before = result.get(phase), previous.get(phase)
+            if now is None or before is None or now < REGRESSION_FLOOR:
+                continue
+            if now > before * REGRESSION_FACTOR:
+                regressions.append(
+                    f"{key} {phase}: {format_seconds(before)} -> {format_seconds(now)}"
+                )
+        for answer in ("answer1", "answer2"):
+            if answer in result and answer in previous and result[answer] != previous[answer]:
+                regressions.append(
+                    f"{key} {answer}: {previous[answer]} -> {result[answer]}"
+                )
+    return regressions
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run and benchmark Advent of Code puzzles.")
+    parser.add_argument("year", nargs="?", choices=YEARS, help="only run this year")
+    parser.add_argument("day", nargs="?", type=int, help="only run this day")
+    parser.add_argument("--part", type=int, choices=(1, 2), help="only run this part")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="seconds before a day is killed")
+    parser.add_argument("--parallel", action="store_true",
+                        help="run every (day, part) in its own process, several at once")
+    parser.add_argument("--workers", type=int,
+                        help="jobs run at once with --parallel (default: CPU count)")
+    parser.add_argument("--baseline", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="report regressions against a JSON baseline")
+    args = parser.parse_args()
+
+    days = discover_days((args.year,) if args.year else YEARS, args.day)
+    if not days:
+        print("No puzzles found")
+        sys.exit(1)
+    parts = (args.part,) if args.part else (1, 2)
+
+    start = time.perf_counter()
+    if args.parallel:
+        results = run_parallel(days, parts, args.timeout, args.workers, load_timings())
+    else:
+        results = {}
+        for day in days:
+            print(f"Running {day.key}...", end="\r", flush=True)
+            results[day.key] = run_day(day, parts, args.timeout)
+        print(" " * 20, end="\r")
+    elapsed = time.perf_counter() - start
+    save_timings(results)
+
+    print_report(results)
+    total = sum(result.get(phase) or 0 for result in results.values() for phase in PHASES)
+    print(f"\nWall time {format_seconds(elapsed)} (sum of phases {format_seconds(total)})")
+
+    if args.baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True))
+        print(f"\nBaseline written to {args.baseline}")
+
+    if args.compare:
+        regressions = find_regressions(results, json.loads(args.compare.read_text()))
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Shared helpers for Advent of Code puzzles.
+"""
+
+
+class Grid:
+    """
+    A 2D character grid stored as one contiguous bytearray.
+
+    Cells are addressed by a flat index ``(row + pad) * stride + (col + pad)``,
+    so moving to a neighbour is a single integer addition with one of the
+    precomputed offsets in ``neighbours4`` / ``neighbours8``. With ``pad`` the
+    grid is surrounded by a border of ``fill`` bytes, which lets neighbour
+    scans skip bounds checks entirely as long as they only look ``pad`` cells
+    away.
+
+    Example:
+        grid = Grid.from_text(raw, pad=1)
+        start = grid.find("S")
+        for offset in grid.neighbours4:
+            if grid.data[start + offset] == ord("#"):
+                ...
+    """
+
+    def __init__(self, data, height, width, pad=0, fill="."):
+        self.data = data
+        self.height = height
+        self.width = width
+        self.pad = pad
+        self.fill = ord(fill)
+        self.stride = width + 2 * pad
+        stride = self.stride
+        self.neighbours4 = (-stride, 1, stride, -1)  # up, right, down, left
+        self.neighbours8 = (
+            -stride - 1, -stride, -stride + 1,
+            -1, 1,
+            stride - 1, stride, stride + 1,
+        )
+
+    @classmethod
+    def from_rows(cls, rows, pad=0, fill="."):
+        """
+        Build a grid from any sequence of rows of single characters.
+
+        Rows shorter than the widest one are padded with fill, so every row
+        takes exactly one stride.
+        """
+        rows = ["".join(row) for row in rows]
+        height = len(rows)
+        width = max(map(len, rows), default=0)
+        stride = width + 2 * pad
+        border = fill * pad
+        lines = [fill * stride] * pad
+        lines += [border + row.ljust(width, fill) + border for row in rows]
+        lines += [fill * stride] * pad
+        return cls(bytearray("".join(lines), "ascii"), height, width, pad, fill)
+
+    @classmethod
+    def from_text(cls, text, pad=0, fill="."):
+        """Build a grid from newline separated text."""
+        return cls.from_rows(text.strip().splitlines(), pad, fill)
+
+    def index(self, row, col):
+        """Flat index of the cell at (row, col)."""
+        return (row + self.pad) * self.stride + col + self.pad
+
+    def position(self, index):
+        """(row, col) of a flat index."""
+        row, col = divmod(index, self.stride)
+        return row - self.pad, col - self.pad
+
+    def in_bounds(self, index):
+        """True if the flat index is a real cell rather than padding."""
+        row, col = self.position(index)
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def __getitem__(self, position):
+        row, col = position
+        return chr(self.data[self.index(row, col)])
+
+    def __setitem__(self, position, value):
+        row, col = position
+        self.data[self.index(row, col)] = ord(value)
+
+    def cells(self):
+        """Flat indices of every real cell, row by row."""
+        stride, pad = self.stride, self.pad
+        for row in range(pad, pad + self.height):
+            start = row * stride + pad
+            yield from range(start, start + self.width)
+
+    def find(self, char):
+        """Flat index of the first occurrence of char in a real cell, or -1."""
+        value = ord(char)
+        for row in range(self.height):
+            start = self.index(row, 0)
+            found = self.data.find(value, start, start + self.width)
+            if found >= 0:
+                return found
+        return -1
+
+    def find_all(self, char):
+        """Flat indices of every occurrence of char."""
+        value = ord(char)
+        return [i for i in self.cells() if self.data[i] == value]
+
+    def row(self, row):
+        """Zero-copy view of one row."""
+        start = self.index(row, 0)
+        return memoryview(self.data)[start:start + self.width]
+
+    def column(self, col):
+        """Zero-copy view of one column."""
+        start = self.index(0, col)
+        end = self.index(self.height - 1, col) + 1
+        return memoryview(self.data)[start:end:self.stride]
+
+    def array(self, padded=False):
+        """
+        Zero-copy NumPy uint8 view of the real cells, shape (height, width),
+        or of the whole buffer including the padding with padded=True.
+        """
+        import numpy as np
+
+        full = np.frombuffer(self.data, dtype=np.uint8).reshape(-1, self.stride)
+        if padded:
+            return full
+        pad = self.pad
+        return full[pad:pad + self.height, pad:pad + self.width]
+
+    def copy(self):
+        return Grid(bytearray(self.data), self.height, self.width, self.pad, chr(self.fill))
+
+    def __str__(self):
+        return "\n".join(self.row(row).tobytes().decode() for row in range(self.height))
@@ -0,0 +1,111 @@
+"""
+Piecewise-linear maps over the integers.
+
+A map is a sorted table of breakpoints: on ``[starts[i], starts[i + 1])``
+every value x maps to ``x + offsets[i]``. Shifting range maps (like the
+"destination source length" tables of 2023 day 5) compose into a single
+table up front, and a sorted list of intervals can then be pushed through
+the whole chain in one merge sweep.
+"""
+from bisect import bisect_right
+from math import inf
+
+
+class PiecewiseMap:
+    def __init__(self, starts, offsets):
+        self.starts = starts
+        self.offsets = offsets
+
+    @classmethod
+    def identity(cls):
+        return cls([-inf], [0])
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """
+        Build a map from (destination, source, length) triples.
+
+        Values outside every source range map to themselves. Source ranges
+        are expected not to overlap.
+        """
+        starts, offsets = [-inf], [0]
+        for destination, source, length in sorted(ranges, key=lambda r: r[1]):
+            if source == starts[-1]:
+                offsets[-1] = destination - source
+            else:
+                starts.append(source)
+                offsets.append(destination - source)
+            starts.append(source + length)
+            offsets.append(0)
+        return cls(starts, offsets)._merged()
+
+    def _merged(self):
+        """Drop breakpoints between pieces with the same offset."""
+        starts, offsets = [self.starts[0]], [self.offsets[0]]
+        for start, offset in zip(self.starts[1:], self.offsets[1:]):
+            if offset == offsets[-1]:
+                continue
+            if start == starts[-1]:
+                offsets[-1] = offset
+                continue
+            starts.append(start)
+            offsets.append(offset)
+        return PiecewiseMap(starts, offsets)
+
+    def pieces(self):
+        """(start, end, offset) for every piece, end exclusive."""
+        ends = self.starts[1:] + [inf]
+        return zip(self.starts, ends, self.offsets)
+
+    def __call__(self, value):
+        return value + self.offsets[bisect_right(self.starts, value) - 1]
+
+    def then(self, other):
+        """The map x -> other(self(x))."""
+        starts, offsets = [], []
+        for start, end, offset in self.pieces():
+            # Walk other's pieces across the image [start + offset, end + offset)
+            i = bisect_right(other.starts, start + offset) - 1
+            low = start
+            while low < end:
+                other_end = other.starts[i + 1] - offset if i + 1 < len(other.starts) else inf
+                starts.append(low)
+                offsets.append(offset + other.offsets[i])
+                low = min(end, other_end)
+                i += 1
+        return PiecewiseMap(starts, offsets)._merged()
+
+    def apply_intervals(self, intervals):
+        """
+        Map half-open (start, end) intervals in a single sweep.
+
+        The intervals are sorted and merged first; the result lists the image
+        of every piece of the merged intervals, in ascending order of the
+        pieces (not of their images).
+        """
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        images = []
+        starts, offsets = self.starts, self.offsets
+        i = 0
+        for start, end in merged:
+            while i + 1 < len(starts) and starts[i + 1] <= start:
+                i += 1
+            low = start
+            while low < end:
+                piece_end = starts[i + 1] if i + 1 < len(starts) else inf
+                high = min(end, piece_end)
+                images.append((low + offsets[i], high + offsets[i]))
+                if high == piece_end:
+                    i += 1
+                low = high
+        return images
+
+    def min_image(self, intervals):
+        """Smallest value any of the intervals maps to."""
+        return min(start for start, _ in self.apply_intervals(intervals))
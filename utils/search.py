@@ -0,0 +1,92 @@
+"""
+Shortest path search over integer-encoded states.
+
+Puzzles describe their state space as plain ints in ``range(num_states)``
+(e.g. ``(cell << 1) | axis``) and a neighbour generator yielding
+``(next_state, weight)`` pairs. Distances live in a flat ``array('l')``
+instead of a dict or a visited set of tuples.
+
+When every edge weight is a small non-negative integer, pass ``max_weight``
+and the search uses a bucket queue (Dial's algorithm): one list per cost
+modulo ``max_weight + 1``, so pushing and popping are O(1). Otherwise a
+binary heap is used, with an optional admissible ``heuristic`` turning
+Dijkstra into A*.
+"""
+import heapq
+from array import array
+
+UNREACHED = -1
+
+
+def shortest_path(starts, neighbours, is_goal, num_states, max_weight=None, heuristic=None):
+    """
+    Find the cheapest path from any start state to a goal state.
+
+    Args:
+        starts: Iterable of start states (ints)
+        neighbours: Function state -> iterable of (next_state, weight)
+        is_goal: Function state -> bool
+        num_states: Upper bound (exclusive) on state values
+        max_weight: Largest possible edge weight; enables the bucket queue
+        heuristic: Optional consistent lower bound state -> remaining cost
+
+    Returns:
+        (cost, goal_state), or None if no goal is reachable
+    """
+    dist = array("l", [UNREACHED]) * num_states
+    if max_weight is not None and heuristic is None:
+        return _bucket_search(starts, neighbours, is_goal, dist, max_weight)
+    return _heap_search(starts, neighbours, is_goal, dist, heuristic)
+
+
+def _bucket_search(starts, neighbours, is_goal, dist, max_weight):
+    size = max_weight + 1
+    buckets = [[] for _ in range(size)]
+    pending = 0
+    for state in starts:
+        dist[state] = 0
+        buckets[0].append(state)
+        pending += 1
+
+    cost = 0
+    while pending:
+        bucket = buckets[cost % size]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            if dist[state] != cost:
+                continue  # stale entry, a cheaper path was found later
+            if is_goal(state):
+                return cost, state
+            for next_state, weight in neighbours(state):
+                new_cost = cost + weight
+                known = dist[next_state]
+                if known == UNREACHED or new_cost < known:
+                    dist[next_state] = new_cost
+                    buckets[new_cost % size].append(next_state)
+                    pending += 1
+        cost += 1
+    return None
+
+
+def _heap_search(starts, neighbours, is_goal, dist, heuristic):
+    estimate = heuristic or (lambda state: 0)
+    queue = []
+    for state in starts:
+        dist[state] = 0
+        queue.append((estimate(state), 0, state))
+    heapq.heapify(queue)
+
+    while queue:
+        _, cost, state = heapq.heappop(queue)
+        if dist[state] != cost:
+            continue
+        if is_goal(state):
+            return cost, state
+        for next_state, weight in neighbours(state):
+            new_cost = cost + weight
+            known = dist[next_state]
+            if known == UNREACHED or new_cost < known:
+                dist[next_state] = new_cost
+                heapq.heappush(queue, (new_cost + estimate(next_state), new_cost, next_state))
+    return None
@@ -0,0 +1,95 @@
+from utils.helpers import Grid
+
+TEST_INPUT = """\
+#.S
+.#.
+..E"""
+
+
+def test_from_text_dimensions():
+    grid = Grid.from_text(TEST_INPUT)
+    assert (grid.height, grid.width, grid.stride) == (3, 3, 3)
+    assert str(grid) == TEST_INPUT
+
+
+def test_padding_surrounds_grid():
+    grid = Grid.from_text(TEST_INPUT, pad=1, fill="~")
+    assert grid.stride == 5
+    assert len(grid.data) == 25
+    assert grid.data[:5] == b"~~~~~"
+    assert str(grid) == TEST_INPUT
+
+
+def test_index_and_position_round_trip():
+    grid = Grid.from_text(TEST_INPUT, pad=2)
+    for row in range(grid.height):
+        for col in range(grid.width):
+            assert grid.position(grid.index(row, col)) == (row, col)
+
+
+def test_find_and_getitem():
+    grid = Grid.from_text(TEST_INPUT, pad=1)
+    assert grid.position(grid.find("S")) == (0, 2)
+    assert grid[2, 2] == "E"
+    assert [grid.position(i) for i in grid.find_all("#")] == [(0, 0), (1, 1)]
+    assert grid.find("X") == -1
+
+
+def test_neighbour_offsets():
+    grid = Grid.from_text(TEST_INPUT, pad=1)
+    centre = grid.index(1, 1)
+    around4 = {grid.position(centre + offset) for offset in grid.neighbours4}
+    assert around4 == {(0, 1), (1, 2), (2, 1), (1, 0)}
+    around8 = [grid[grid.position(centre + offset)] for offset in grid.neighbours8]
+    assert "".join(around8) == "#.S....E"
+
+
+def test_padding_is_out_of_bounds():
+    grid = Grid.from_text(TEST_INPUT, pad=1)
+    corner = grid.index(0, 0)
+    assert grid.in_bounds(corner)
+    assert not any(grid.in_bounds(corner + offset) for offset in (-1, -grid.stride))
+
+
+def test_row_and_column_views_are_zero_copy():
+    grid = Grid.from_text(TEST_INPUT, pad=1)
+    assert grid.row(1).tobytes() == b".#."
+    assert grid.column(2).tobytes() == b"S.E"
+    grid[1, 2] = "X"
+    assert grid.column(2).tobytes() == b"SXE"
+
+
+def test_array_view_shares_memory():
+    grid = Grid.from_text(TEST_INPUT, pad=1)
+    array = grid.array()
+    assert array.shape == (3, 3)
+    array[0, 1] = ord("@")
+    assert grid[0, 1] == "@"
+
+
+def test_padded_array_includes_border():
+    grid = Grid.from_text(TEST_INPUT, pad=1, fill="~")
+    array = grid.array(padded=True)
+    assert array.shape == (5, 5)
+    assert bytes(array[0]) == b"~~~~~"
+    assert bytes(array[1, 1:-1]) == b"#.S"
+
+
+def test_from_rows_accepts_lists():
+    grid = Grid.from_rows([["a", "b"], ["c", "d"]])
+    assert str(grid) == "ab\ncd"
+    assert str(grid.copy()) == "ab\ncd"
+
+
+def test_find_skips_padding():
+    grid = Grid.from_text("#.\n..", pad=1)
+    assert grid.position(grid.find(".")) == (0, 1)
+    assert grid.find("#") == grid.index(0, 0)
+
+
+def test_ragged_rows_are_padded_to_widest():
+    grid = Grid.from_rows(["abc", "d", "ef"], pad=1, fill="~")
+    assert (grid.height, grid.width) == (3, 3)
+    assert len(grid.data) == 5 * grid.stride
+    assert str(grid) == "abc\nd~~\nef~"
+    assert grid[2, 1] == "f"
@@ -0,0 +1,28 @@
+from utils.intervals import PiecewiseMap
+
+# 50 98 2 / 52 50 48 from the 2023 day 5 example
+SEED_TO_SOIL = PiecewiseMap.from_ranges([(50, 98, 2), (52, 50, 48)])
+
+
+def test_point_lookup():
+    assert [SEED_TO_SOIL(x) for x in (0, 49, 50, 97, 98, 99, 100)] == [0, 49, 52, 99, 50, 51, 100]
+
+
+def test_adjacent_ranges_with_same_offset_merge():
+    mapping = PiecewiseMap.from_ranges([(10, 0, 5), (15, 5, 5)])
+    assert mapping.starts[1:] == [0, 10]
+
+
+def test_then_matches_pointwise_composition():
+    second = PiecewiseMap.from_ranges([(0, 15, 37), (37, 52, 2), (39, 0, 15)])
+    composed = SEED_TO_SOIL.then(second)
+    assert all(composed(x) == second(SEED_TO_SOIL(x)) for x in range(-5, 120))
+
+
+def test_apply_intervals_splits_at_breakpoints():
+    images = SEED_TO_SOIL.apply_intervals([(96, 101), (40, 52)])
+    assert images == [(40, 50), (52, 54), (98, 100), (50, 52), (100, 101)]
+
+
+def test_min_image_merges_overlaps():
+    assert SEED_TO_SOIL.min_image([(95, 99), (97, 100)]) == 50
@@ -0,0 +1,48 @@
+import pytest
+
+from utils.search import shortest_path
+
+# 0 -> 1 -> 3 costs 1 + 1, 0 -> 2 -> 3 costs 4 + 0, 0 -> 3 costs 5
+GRAPH = {
+    0: [(1, 1), (2, 4), (3, 5)],
+    1: [(3, 1)],
+    2: [(3, 0)],
+    3: [],
+    4: [(3, 1)],
+}
+
+
+def neighbours(state):
+    return GRAPH[state]
+
+
+@pytest.mark.parametrize("max_weight", [None, 5])
+def test_cheapest_path(max_weight):
+    found = shortest_path([0], neighbours, lambda s: s == 3, len(GRAPH), max_weight)
+    assert found == (2, 3)
+
+
+@pytest.mark.parametrize("max_weight", [None, 5])
+def test_unreachable_goal(max_weight):
+    assert shortest_path([0], neighbours, lambda s: s == 4, len(GRAPH), max_weight) is None
+
+
+@pytest.mark.parametrize("max_weight", [None, 5])
+def test_multiple_starts(max_weight):
+    found = shortest_path([0, 4], neighbours, lambda s: s == 3, len(GRAPH), max_weight)
+    assert found == (1, 3)
+
+
+def test_zero_weight_edges_in_buckets():
+    graph = {0: [(1, 0)], 1: [(2, 0)], 2: []}
+    found = shortest_path([0], graph.__getitem__, lambda s: s == 2, 3, max_weight=1)
+    assert found == (0, 2)
+
+
+def test_a_star_on_a_line():
+    # States 0..9 on a line, goal at 9, admissible heuristic = distance left
+    def line(state):
+        return [(n, 1) for n in (state - 1, state + 1) if 0 <= n < 10]
+
+    found = shortest_path([0], line, lambda s: s == 9, 10, heuristic=lambda s: 9 - s)
+    assert found == (9, 9)